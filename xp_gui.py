@@ -19,23 +19,33 @@
 # --- Standard library ---
 import os
 import re
+import bisect
 import sys
 import json
 import ctypes
+import functools
+import hashlib
 import shutil
 import subprocess
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 import datetime
 import time
-import webbrowser
+import queue
+import threading
 from pathlib import Path
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 # --- Third-party ---
 import ttkbootstrap as tb
 from ttkbootstrap.constants import *
 from PIL import Image, ImageTk
-from tkinterdnd2 import DND_FILES, TkinterDnD
+
+# valfri: snabbare JSON för presets/manifests, annars stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # --- Tkinter ---
 import tkinter as tk
@@ -49,11 +59,37 @@ class FlashlightParams:
     regen_delay: float
 
 
+@dataclass(slots=True)
+class PatcherBundle:
+    """Patcher-listor per målfil, returneras av get_patchers_for_build."""
+    player: list = field(default_factory=list)
+    prog: list = field(default_factory=list)
+    inv: list = field(default_factory=list)
+    overlay: list = field(default_factory=list)
+    hunger: list = field(default_factory=list)
+    night: list = field(default_factory=list)
+    volatiles: list = field(default_factory=list)
+    aipresetpool: list = field(default_factory=list)
+    ai_difficulty: list = field(default_factory=list)
+    ai_spawn_priority: list = field(default_factory=list)
+    ai_spawn_system: list = field(default_factory=list)
+    spawn_logic: list = field(default_factory=list)
+    densitiessettings: list = field(default_factory=list)
+    healthdefinitions: list = field(default_factory=list)
+    inputs_keyboard: list = field(default_factory=list)
+    fuel: list = field(default_factory=list)
+
+
 APP_NAME = "DLTB Configurator"
 OUTPUT_DIR = "output"
 PAK_NAME = "data7.pak"
+# .scr är små textfiler; deflate kostar bara CPU och spelet läser stored entries
+PAK_COMPRESSION = zipfile.ZIP_STORED
 STATUS_REF = [None]
 APP_ROOT = Path(__file__).resolve().parent
+HOME = Path.home()
+DOWNLOADS = HOME / "Downloads"
+DESKTOP = HOME / "Desktop"
 
 def status(items):
     cb = STATUS_REF[0]
@@ -101,19 +137,62 @@ except Exception:
 # Sen layout-grejer
 root.minsize(1050, 650)
 
+def json_loads_bytes(raw: bytes):
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw.decode("utf-8"))
+
+def json_dumps_bytes(obj) -> bytes:
+    # indent=2 i båda fallen så filerna går att läsa/diffa för hand
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
 def _load_tools_cfg() -> dict:
     try:
-        if SMM_CONFIG_PATH.exists():
-            return json.loads(SMM_CONFIG_PATH.read_text(encoding="utf-8"))
+        return json_loads_bytes(SMM_CONFIG_PATH.read_bytes())
+    except FileNotFoundError:
+        return {}
     except Exception:
         pass
     return {}
 
 def _save_tools_cfg(cfg: dict):
     SMM_CONFIG_PATH.parent.mkdir(parents=True, exist_ok=True)
-    SMM_CONFIG_PATH.write_text(json.dumps(cfg, indent=2), encoding="utf-8")
+    SMM_CONFIG_PATH.write_bytes(json_dumps_bytes(cfg))
+
+def _shallow_find(root: Path, name: str, max_depth: int = 3) -> Path | None:
+    # bredden-först med djupgräns istället för rglob över hela trädet
+    want = name.lower()
+    level = [os.fspath(root)]
+    for _depth in range(max_depth + 1):
+        next_level = []
+        for d in level:
+            try:
+                with os.scandir(d) as it:
+                    for e in it:
+                        if e.name.lower() == want and e.is_file():
+                            return Path(e.path)
+                        if e.is_dir(follow_symlinks=False):
+                            next_level.append(e.path)
+            except OSError:
+                pass
+        level = next_level
+    return None
+
+# upplösta exe-paths; sökningen (särskilt Downloads) görs en gång per process
+_SMM_EXE = [None]
+_SEVEN_EXE = [None]
 
 def find_super_mod_merger_exe() -> Path | None:
+    cached = _SMM_EXE[0]
+    if cached is not None and cached.exists():
+        return cached
+    exe = _find_super_mod_merger_exe()
+    _SMM_EXE[0] = exe
+    return exe
+
+def _find_super_mod_merger_exe() -> Path | None:
     # 1) sparad path
     cfg = _load_tools_cfg()
     p = cfg.get("super_mod_merger_exe")
@@ -134,23 +213,15 @@ def find_super_mod_merger_exe() -> Path | None:
 
     # 3) vanliga nedladdningsställen
     candidates = [
-        Path.home() / "Downloads" / "SuperModMerger.exe",
-        Path.home() / "Desktop" / "SuperModMerger.exe",
+        DOWNLOADS / "SuperModMerger.exe",
+        DESKTOP / "SuperModMerger.exe",
     ]
     for c in candidates:
         if c.exists():
             return c
 
-    # 4) sök i senaste Downloads-zip-extract-mappar (lite dyrt men ok)
-    dl = Path.home() / "Downloads"
-    if dl.exists():
-        try:
-            for exe in dl.rglob("SuperModMerger.exe"):
-                return exe
-        except Exception:
-            pass
-
-    return None
+    # 4) sök i Downloads-zip-extract-mappar, bara några nivåer ner (Downloads/<mod>/.../exe)
+    return _shallow_find(DOWNLOADS, "SuperModMerger.exe", max_depth=3)
 
 def pick_super_mod_merger_exe() -> Path | None:
     p = filedialog.askopenfilename(
@@ -163,8 +234,23 @@ def pick_super_mod_merger_exe() -> Path | None:
     cfg = _load_tools_cfg()
     cfg["super_mod_merger_exe"] = str(exe)
     _save_tools_cfg(cfg)
+    _SMM_EXE[0] = exe
     return exe
 
+def _create_junction(target: Path, link: Path):
+    # _winapi.CreateJunction (samma som stdlib använder internt) -> ingen cmd.exe-process
+    try:
+        import _winapi
+        _winapi.CreateJunction(str(target), str(link))
+        return
+    except (ImportError, AttributeError, OSError):
+        pass
+    subprocess.run(
+        ["cmd", "/c", "mklink", "/J", str(link), str(target)],
+        check=True,
+        creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
+    )
+
 def run_super_mod_merger(game_root: Path):
     exe = find_super_mod_merger_exe()
     if not exe:
@@ -181,28 +267,30 @@ def run_super_mod_merger(game_root: Path):
 
     # SMM behöver se ./mods (din app) + data0.pak (ph_ft)
     # Lösning: kör i ph_ft och skapa en länk/junction 'mods' -> din app's mods
-    app_root = Path(__file__).resolve().parent
-    mods_src = app_root / "mods"
+    mods_src = APP_ROOT / "mods"
     mods_link = phft / "mods"
 
     try:
         mods_src.mkdir(exist_ok=True)
 
-        if not mods_link.exists():
+        # lexists: en trasig junction räknas också som "finns" (mklink skulle faila på den)
+        if not os.path.lexists(mods_link):
             # Windows junction: ph_ft/mods -> <app_root>/mods
-            subprocess.run(["cmd", "/c", "mklink", "/J", str(mods_link), str(mods_src)], check=True)
+            _create_junction(mods_src, mods_link)
 
         subprocess.Popen([str(exe)], cwd=str(phft))
         status([(" Opened Super Mod Merger ✔  ", "ok"), ("Run merge, then Play Game.", "warn")])
     except Exception as e:
         status([(" Failed to start Super Mod Merger: ", "warn"), (str(e), "warn")])
         
+@functools.lru_cache(maxsize=256)
 def files_url(mod_id: int, file_id: int | None = None) -> str:
     url = f"https://www.nexusmods.com/dyinglightthebeast/mods/{mod_id}?tab=files"
     if file_id:
         url += f"&file_id={file_id}"
     return url
 
+@functools.lru_cache(maxsize=256)
 def nmm_url(mod_id: int, file_id: int) -> str:
     return f"https://www.nexusmods.com/dyinglightthebeast/mods/{mod_id}?tab=files&file_id={file_id}&nmm=1"
 
@@ -287,6 +375,14 @@ def pick_mod_archive():
     return Path(path) if path else None
     
 def find_7z_exe() -> Path | None:
+    cached = _SEVEN_EXE[0]
+    if cached is not None and cached.exists():
+        return cached
+    seven = _find_7z_exe()
+    _SEVEN_EXE[0] = seven
+    return seven
+
+def _find_7z_exe() -> Path | None:
     # 1) bundlad (rekommenderat)
     bundled = Path(resource_path("assets/tools/7z.exe"))
     if bundled.exists():
@@ -305,29 +401,43 @@ def find_7z_exe() -> Path | None:
     p = shutil.which("7z")
     return Path(p) if p else None
 
-def extract_archive(archive_path: Path, dest_dir: Path):
+def _extract_archive(archive_path: Path, dest_dir: Path) -> tuple[str, str] | None:
+    """Kör 7z utan UI; returnerar (titel, fel) vid fel, annars None. Trådsäker."""
     dest_dir.mkdir(parents=True, exist_ok=True)
 
     seven = find_7z_exe()
     if not seven:
-        messagebox.showerror(
+        return (
             "7-Zip not found",
             "To install .rar/.7z mods, include assets/tools/7z.exe (and 7z.dll) "
             "or install 7-Zip to C:\\Program Files\\7-Zip."
         )
-        return False
 
     # 7z x = extract with full paths, -y = yes to all, -o = output dir
-    cmd = [str(seven), "x", str(archive_path), f"-o{dest_dir}", "-y"]
+    # -bso0/-bsp0 = ingen logg/progress på stdout; fel kommer fortfarande på stderr
+    cmd = [str(seven), "x", str(archive_path), f"-o{dest_dir}", "-y", "-bso0", "-bsp0"]
     try:
-        r = subprocess.run(cmd, capture_output=True, text=True, check=False)
+        r = subprocess.run(
+            cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            close_fds=False,
+            creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
+            check=False,
+        )
         if r.returncode != 0:
-            messagebox.showerror("Extract failed", (r.stderr or r.stdout or "Unknown error").strip())
-            return False
-        return True
+            err = r.stderr.decode("utf-8", errors="replace").strip()
+            return ("Extract failed", err or f"7z exit code {r.returncode}")
+        return None
     except Exception as e:
-        messagebox.showerror("Extract failed", str(e))
+        return ("Extract failed", str(e))
+
+def extract_archive(archive_path: Path, dest_dir: Path):
+    err = _extract_archive(archive_path, dest_dir)
+    if err is not None:
+        messagebox.showerror(*err)
         return False
+    return True
 
 import time
 
@@ -341,7 +451,21 @@ def flatten_single_root_folder(dest: Path):
 
 
 
+# en install i taget: workern extraherar in i mod_root, en andra overwrite skulle flytta bort den
+_INSTALL_BUSY = [False]
+INSTALL_BTN_REF = [None]
+
+def _set_install_busy(busy: bool):
+    _INSTALL_BUSY[0] = busy
+    btn = INSTALL_BTN_REF[0]
+    if btn is not None:
+        btn.config(state=("disabled" if busy else "normal"))
+
 def install_mod_archive_button():
+    if _INSTALL_BUSY[0]:
+        status([("Install already running…", "warn")])
+        return
+
     # Visa direkt att något händer (innan fil-dialogen)
     status([("Opening file dialog…", "warn")])
     root.update_idletasks()
@@ -369,55 +493,92 @@ def install_mod_archive_button():
         if not messagebox.askyesno("Overwrite?", f"{mod_name} already exists. Overwrite?"):
             status([("Install aborted (not overwriting).", "warn")])
             return
-        shutil.rmtree(mod_root, ignore_errors=True)
+        _MANIFEST_CACHE.pop(mod_root, None)
+        invalidate_mods_cache()
+        try:
+            discard_dir(mod_root)
+        except OSError:
+            shutil.rmtree(mod_root, ignore_errors=True)
 
     raw_dir.mkdir(parents=True, exist_ok=True)
 
     status([("Extracting archive…", "warn")])
-    root.update_idletasks()
 
-    t1 = time.perf_counter()
-    ok = extract_archive(archive, raw_dir)
-    dt_extract = time.perf_counter() - t1
+    # extract + indexering + manifest i egen tråd; UI-uppdateringar går via kön
+    ui_q = queue.Queue()
 
-    if not ok:
-        shutil.rmtree(mod_root, ignore_errors=True)
-        status([("Extract failed. Nothing was installed.", "warn")])
-        return
+    def _work():
+        t1 = time.perf_counter()
+        err = _extract_archive(archive, raw_dir)
+        dt_extract = time.perf_counter() - t1
+
+        if err is not None:
+            shutil.rmtree(mod_root, ignore_errors=True)
+            ui_q.put(("error", err))
+            ui_q.put(("done", [("Extract failed. Nothing was installed.", "warn")]))
+            return
 
-    # optional
-    flatten_single_root_folder(raw_dir)
+        # optional
+        flatten_single_root_folder(raw_dir)
+
+        ui_q.put(("status", [(f"Extract OK ({dt_extract:.2f}s). Indexing files…", "ok")]))
+
+        # indexera filer (ett scandir-pass; relativ path via prefix istället för relpath per fil)
+        base_len = len(os.path.join(os.fspath(raw_dir), ""))
+        files = []
+        scr_files = []
+        for e in _iter_files(raw_dir):
+            rel = e.path[base_len:].replace("\\", "/")
+            files.append(rel)
+            if e.name.lower().endswith(".scr"):
+                scr_files.append(rel)
+
+        manifest = {
+            "name": mod_name,
+            "installed_at": datetime.datetime.now().isoformat(timespec="seconds"),
+            "enabled": True,
+            "archive_path": str(archive),
+            "raw_dir": str(raw_dir),
+            "files": files,
+            "scr_files": scr_files,
+            "priority": {},  # ex: {"player_variables.scr": "mod_wins"}
+        }
 
-    status([(f"Extract OK ({dt_extract:.2f}s). Indexing files…", "ok")])
-    root.update_idletasks()
+        ui_q.put(("status", [("Writing manifest…", "warn")]))
 
-    # indexera filer
-    files = [str(p.relative_to(raw_dir)).replace("\\", "/")
-             for p in raw_dir.rglob("*") if p.is_file()]
-    scr_files = [f for f in files if f.lower().endswith(".scr")]
-
-    manifest = {
-        "name": mod_name,
-        "installed_at": datetime.datetime.now().isoformat(timespec="seconds"),
-        "enabled": True,
-        "archive_path": str(archive),
-        "raw_dir": str(raw_dir),
-        "files": files,
-        "scr_files": scr_files,
-        "priority": {},  # ex: {"player_variables.scr": "mod_wins"}
-    }
+        (mod_root / "manifest.json").write_bytes(json_dumps_bytes(manifest))
+        invalidate_mods_cache()
 
-    status([("Writing manifest…", "warn")])
-    root.update_idletasks()
+        ui_q.put(("done", [
+            ("Mod added to Configurator ✔", "ok"),
+            ("Next: Deploy → Apply → Build & Install PAK", "warn"),
+        ]))
 
-    (mod_root / "manifest.json").write_text(
-        json.dumps(manifest, indent=2), encoding="utf-8"
-    )
+    def _do():
+        try:
+            _work()
+        except Exception as e:
+            ui_q.put(("error", ("Install failed", str(e))))
+            ui_q.put(("done", [("Install failed.", "warn")]))
 
-    status([
-        ("Mod added to Configurator ✔", "ok"),
-        ("Next: Deploy → Apply → Build & Install PAK", "warn"),
-    ])
+    def _poll():
+        while True:
+            try:
+                kind, payload = ui_q.get_nowait()
+            except queue.Empty:
+                root.after(100, _poll)
+                return
+            if kind == "error":
+                messagebox.showerror(*payload)
+            else:
+                status(payload)
+                if kind == "done":
+                    _set_install_busy(False)
+                    return
+
+    _set_install_busy(True)
+    threading.Thread(target=_do, daemon=True).start()
+    root.after(100, _poll)
 
 def open_url(url: str):
     url = (url or "").strip()
@@ -426,6 +587,8 @@ def open_url(url: str):
         messagebox.showwarning("Open link", "Empty URL")
         return
 
+    import webbrowser  # bara när en länk öppnas
+
     try:
         # robustare än webbrowser.open i vissa lägen
         webbrowser.open_new_tab(url)
@@ -433,43 +596,59 @@ def open_url(url: str):
         messagebox.showerror("Open link failed", str(e))
 
 def open_mod_files(mod: dict):
-    open_url(files_url(mod["mod_id"], mod.get("file_id")))
+    open_url(mod.get("url") or files_url(mod["mod_id"], mod.get("file_id")))
 
 def open_mod_manager(mod: dict):
     file_id = mod.get("file_id")
     if not file_id:
         messagebox.showinfo("Not available", "No file_id set for this mod.")
         return
-    open_url(nmm_url(mod["mod_id"], file_id))
+    open_url(mod.get("nmm_url") or nmm_url(mod["mod_id"], file_id))
 
 SCRIPTS_DIR = Path("scripts")  # "DLTB Configurator\\scripts" när du kör från projektroten
 MODS_DIR = Path("mods") / "installed"
+MODS_TRASH_DIR = Path("mods") / ".trash"  # utanför MODS_DIR så listan inte ser den
+
+def discard_dir(path: Path):
+    """
+    Flytta path till MODS_TRASH_DIR (snabb rename) och radera i bakgrunden.
+    Rename-fel (t.ex. låst fil) bubblar upp till anroparen.
+    """
+    MODS_TRASH_DIR.mkdir(parents=True, exist_ok=True)
+    trash = MODS_TRASH_DIR / f"{path.name}-{time.time_ns()}"
+    path.rename(trash)
+    threading.Thread(target=shutil.rmtree, args=(trash,), kwargs={"ignore_errors": True},
+                     daemon=True).start()
+
+def sweep_mods_trash():
+    """Best effort: radera rester i MODS_TRASH_DIR (avbruten radering, låsta filer förra körningen)."""
+    def _sweep():
+        try:
+            with os.scandir(MODS_TRASH_DIR) as it:
+                leftovers = [e.path for e in it]
+        except OSError:
+            return
+        for p in leftovers:
+            shutil.rmtree(p, ignore_errors=True)
+
+    threading.Thread(target=_sweep, daemon=True).start()
 
-PARAM_RE = re.compile(r'(?m)^\s*Param\("([^"]+)"\s*,\s*"([^"]*)"\)\s*;\s*$')
+# .scr är ASCII -> re.ASCII ger billigare \s-matchning
+PARAM_RE = re.compile(r'^\s*Param\("([^"]+)"\s*,\s*"([^"]*)"\)\s*;\s*$', re.MULTILINE | re.ASCII)
 
 def get_enabled_mods() -> list[tuple[Path, dict]]:
-    mods = []
-    if not MODS_DIR.exists():
-        return mods
-    for mod_root in sorted(MODS_DIR.iterdir()):
-        if not mod_root.is_dir():
-            continue
-        mf = mod_root / "manifest.json"
-        if not mf.exists():
-            continue
-        try:
-            manifest = json.loads(mf.read_text(encoding="utf-8"))
-        except Exception:
-            continue
-        if manifest.get("enabled", False):
-            mods.append((mod_root, manifest))
-    return mods
+    return [(mod_root, manifest) for mod_root, manifest in list_installed_mods()
+            if manifest.get("enabled", False)]
 
 def extract_params(text: str) -> dict[str, str]:
-    return {m.group(1): m.group(2) for m in PARAM_RE.finditer(text)}
+    return dict(PARAM_RE.findall(text))
+
+@functools.lru_cache(maxsize=4096)
+def _param_pat(name: str):
+    return re.compile(rf'^(\s*Param\("{re.escape(name)}"\s*,\s*")([^"]*)("\)\s*;\s*)$', re.MULTILINE | re.ASCII)
 
 def replace_param(text: str, name: str, value: str) -> str:
-    pat = re.compile(rf'(?m)^(\s*Param\("{re.escape(name)}"\s*,\s*")([^"]*)("\)\s*;\s*)$')
+    pat = _param_pat(name)
     if not pat.search(text):
         return text
     return pat.sub(rf'\g<1>{value}\g<3>', text, count=1)
@@ -477,22 +656,45 @@ def replace_param(text: str, name: str, value: str) -> str:
 def merge_scr(config_text: str, mod_text: str, mod_wins: bool) -> tuple[str, list[tuple[str,str,str]]]:
     cfg = extract_params(config_text)
     mod = extract_params(mod_text)
-    merged = config_text
-    conflicts = []
-
-    for k, mod_val in mod.items():
-        if k in cfg and cfg[k] != mod_val:
-            conflicts.append((k, cfg[k], mod_val))
-            if mod_wins:
-                merged = replace_param(merged, k, mod_val)
-
-    return merged, conflicts
+    conflicts = [(k, cfg[k], mod_val) for k, mod_val in mod.items()
+                 if k in cfg and cfg[k] != mod_val]
+    if not (mod_wins and conflicts):
+        return config_text, conflicts
+
+    # ett enda pass över config-texten; första förekomsten av varje nyckel byts
+    pending = {k: mod_val for k, _, mod_val in conflicts}
+
+    def _sub(m):
+        k = m.group(1)
+        if k not in pending:
+            return m.group(0)
+        s0 = m.start(0)
+        line = m.group(0)
+        return line[:m.start(2) - s0] + pending.pop(k) + line[m.end(2) - s0:]
+
+    return PARAM_RE.sub(_sub, config_text), conflicts
+
+def _iter_files(root):
+    # scandir-walk; DirEntry.is_file/is_dir använder readdir-datan, ingen stat per fil
+    stack = [os.fspath(root)]
+    while stack:
+        d = stack.pop()
+        try:
+            it = os.scandir(d)
+        except OSError:
+            continue
+        with it:
+            for e in it:
+                if e.is_dir(follow_symlinks=False):
+                    stack.append(e.path)
+                elif e.is_file(follow_symlinks=False):
+                    yield e
 
 def find_all_mod_scr_files(mod_root: Path) -> list[Path]:
     raw_dir = mod_root / "raw"
     if not raw_dir.exists():
         return []
-    return [p for p in raw_dir.rglob("*.scr") if p.is_file()]
+    return [Path(e.path) for e in _iter_files(raw_dir) if e.name.lower().endswith(".scr")]
 
 def apply_enabled_mods_to_scripts(scripts_dir: Path, default_policy: str = "config_wins"):
     """
@@ -506,35 +708,54 @@ def apply_enabled_mods_to_scripts(scripts_dir: Path, default_policy: str = "conf
     if not enabled:
         return
 
+    # policy per mod (valfritt senare)
+    mod_wins_default = (default_policy == "mod_wins")
+
+    # target_name -> [(mod_name, mod_scr)] i mod-ordning; varje target läses/skrivs en gång
+    targets: dict[str, list[tuple[str, Path]]] = {}
     for mod_root, manifest in enabled:
         mod_name = manifest.get("name", mod_root.name)
+        for mod_scr in find_all_mod_scr_files(mod_root):
+            targets.setdefault(mod_scr.name, []).append((mod_name, mod_scr))
 
-        # policy per mod (valfritt senare)
-        mod_wins_default = (default_policy == "mod_wins")
+    for target_name, entries in targets.items():
+        out_scr = scripts_dir / target_name
 
-        for mod_scr in find_all_mod_scr_files(mod_root):
-            target_name = mod_scr.name
-            out_scr = scripts_dir / target_name
+        # Om config redan har filen → merge Param() (en läsning, ingen exists()-stat först)
+        try:
+            merged = out_scr.read_text(encoding="utf-8", errors="ignore")
+        except FileNotFoundError:
+            merged = None
+        original = merged
+
+        if merged is None and len(entries) == 1:
+            # Config har inte filen → kopiera in den
+            mod_name, mod_scr = entries[0]
+            shutil.copy2(mod_scr, out_scr)
+            print(f"[MOD COPY] {mod_name} copied {target_name}")
+            continue
 
+        for mod_name, mod_scr in entries:
             mod_text = mod_scr.read_text(encoding="utf-8", errors="ignore")
 
-            # Om config redan har filen → merge Param()
-            if out_scr.exists():
-                cfg_text = out_scr.read_text(encoding="utf-8", errors="ignore")
+            if merged is None:
+                # första moden står för filen, resten mergas in i den
+                merged = mod_text
+                print(f"[MOD COPY] {mod_name} copied {target_name}")
+                continue
 
-                # här kan du senare läsa per-fil policy ur manifest["priority"][target_name]
-                mod_wins = mod_wins_default
+            # här kan du senare läsa per-fil policy ur manifest["priority"][target_name]
+            mod_wins = mod_wins_default
 
-                merged, conflicts = merge_scr(cfg_text, mod_text, mod_wins)
-                out_scr.write_text(merged, encoding="utf-8")
+            merged, conflicts = merge_scr(merged, mod_text, mod_wins)
 
-                # (valfritt) logga konflikter för debug
-                if conflicts:
-                    print(f"[MOD MERGE] {mod_name} conflicts in {target_name}: {len(conflicts)}")
-            else:
-                # Config har inte filen → kopiera in den
-                shutil.copy2(mod_scr, out_scr)
-                print(f"[MOD COPY] {mod_name} copied {target_name}")
+            # (valfritt) logga konflikter för debug
+            if conflicts:
+                print(f"[MOD MERGE] {mod_name} conflicts in {target_name}: {len(conflicts)}")
+
+        # config_wins / inga konflikter -> samma text, rör inte filen (mtime, pak-hash)
+        if merged != original:
+            out_scr.write_text(merged, encoding="utf-8")
 
 def find_mod_file(mod_root: Path, filename: str) -> Path | None:
     raw_dir = mod_root / "raw"
@@ -543,18 +764,31 @@ def find_mod_file(mod_root: Path, filename: str) -> Path | None:
     hits = list(raw_dir.rglob(filename))
     return hits[0] if hits else None
         
+# mod_root -> (mtime_ns, size, manifest); slipper json-parse vid varje refresh
+_MANIFEST_CACHE: dict[Path, tuple[int, int, dict]] = {}
+
 def load_manifest(mod_root: Path) -> dict | None:
     p = mod_root / "manifest.json"
-    if not p.exists():
+    try:
+        st = os.stat(p)
+    except OSError:
+        _MANIFEST_CACHE.pop(mod_root, None)
         return None
+    hit = _MANIFEST_CACHE.get(mod_root)
+    if hit and hit[0] == st.st_mtime_ns and hit[1] == st.st_size:
+        return hit[2]
     try:
-        return json.loads(p.read_text(encoding="utf-8"))
+        manifest = json_loads_bytes(p.read_bytes())
     except Exception:
         return None
+    _MANIFEST_CACHE[mod_root] = (st.st_mtime_ns, st.st_size, manifest)
+    return manifest
 
 def save_manifest(mod_root: Path, manifest: dict):
+    _MANIFEST_CACHE.pop(mod_root, None)
+    invalidate_mods_cache()
     p = mod_root / "manifest.json"
-    p.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    p.write_bytes(json_dumps_bytes(manifest))
 
 def build_installed_mods_ui(parent):
     frame = tb.Labelframe(parent, text="Installed Mods", padding=6)
@@ -588,11 +822,11 @@ def build_installed_mods_ui(parent):
         lb.delete(0, "end")
         data["mods"] = list_installed_mods()
 
-        for mod_root, manifest in data["mods"]:
-            enabled = manifest.get("enabled", False)
-            name = manifest.get("name", mod_root.name)
-            prefix = "✅ " if enabled else "⛔ "
-            lb.insert("end", prefix + name)
+        # ett Tcl-anrop för hela listan istället för ett insert per mod
+        names = [("✅ " if manifest.get("enabled", False) else "⛔ ") + manifest.get("name", mod_root.name)
+                 for mod_root, manifest in data["mods"]]
+        if names:
+            lb.insert("end", *names)
 
         if data["mods"]:
             lb.selection_set(0)
@@ -685,6 +919,7 @@ def build_recommended_mods_ui(parent, set_status_cb=None):
     btn_install = tb.Button(btn_row, text="1. Install Archive (.zip/.rar)", bootstyle=INFO)
     btn_install.pack(side="left", padx=(8, 0))
     btn_install.config(command=install_mod_archive_button)
+    INSTALL_BTN_REF[0] = btn_install
     
     btn_deploy = tb.Button(btn_row, text="2. Deploy Enabled Mods", bootstyle="warning-outline")
     btn_deploy.pack(side="left", padx=(8, 0))
@@ -692,8 +927,7 @@ def build_recommended_mods_ui(parent, set_status_cb=None):
     deployed_lb = tk.Listbox(bottom_block, height=4)
     deployed_lb.pack(fill="x", expand=False, pady=(4, 0))
 
-    for m in RECOMMENDED_MODS:
-        lb.insert("end", m["name"])
+    lb.insert("end", *(m["name"] for m in RECOMMENDED_MODS))
 
     def get_selected_mod():
         sel = lb.curselection()
@@ -714,7 +948,7 @@ def build_recommended_mods_ui(parent, set_status_cb=None):
         affects_txt = ", ".join(affects) if affects else "—"
         notes = m.get("notes")
         notes_txt = f" | Notes: {notes}" if notes else ""
-        url_txt = files_url(m["mod_id"], m.get("file_id"))
+        url_txt = m["url"]  # förberäknad i ensure_mod_urls
         details.config(text=f"{m['name']} | Affects: {affects_txt}{notes_txt} | {url_txt}")
 
     def on_files():
@@ -742,8 +976,8 @@ def build_recommended_mods_ui(parent, set_status_cb=None):
         deployed = deploy_enabled_mod_files(gp)
 
         deployed_lb.delete(0, "end")
-        for p in deployed:
-            deployed_lb.insert("end", p)
+        if deployed:
+            deployed_lb.insert("end", *deployed)
 
         if _cb:
             if deployed:
@@ -773,6 +1007,7 @@ def build_recommended_mods_ui(parent, set_status_cb=None):
 # ---- Deploy helpers ----
 ASSETS_PC_RE = re.compile(r"^assets_(\d+)_pc$", re.IGNORECASE)   # matchar p.stem
 DATA_PAK_RE  = re.compile(r"^data(\d+)$", re.IGNORECASE)         # matchar p.stem ("data5")
+DATA_PAK_FILE_RE = re.compile(r"^data\d+\.pak$", re.IGNORECASE)   # matchar hela filnamnet
 
 def bind_mousewheel_to_listbox(lb: tk.Listbox):
     def _on_mousewheel(event):
@@ -787,7 +1022,7 @@ def bind_mousewheel_to_listbox(lb: tk.Listbox):
     lb.bind("<Button-4>", lambda e: (lb.yview_scroll(-1, "units"), "break"))
     lb.bind("<Button-5>", lambda e: (lb.yview_scroll(1, "units"), "break"))
 
-def find_free_slot(dir_path: Path, stem_re: re.Pattern, max_slots: int) -> int | None:
+def used_slots(dir_path: Path, stem_re: re.Pattern) -> set[int]:
     used = set()
     if dir_path.exists():
         for p in dir_path.iterdir():
@@ -795,10 +1030,13 @@ def find_free_slot(dir_path: Path, stem_re: re.Pattern, max_slots: int) -> int |
                 m = stem_re.match(p.stem)
                 if m:
                     used.add(int(m.group(1)))
-    for i in range(1, max_slots + 1):
-        if i not in used:
-            return i
-    return None
+    return used
+
+def _first_free(used: set[int], max_slots: int) -> int | None:
+    return next((i for i in range(1, max_slots + 1) if i not in used), None)
+
+def find_free_slot(dir_path: Path, stem_re: re.Pattern, max_slots: int) -> int | None:
+    return _first_free(used_slots(dir_path, stem_re), max_slots)
 
 def deploy_enabled_mod_files(game_root: Path) -> list[str]:
     game_root = Path(str(game_root).strip())
@@ -824,6 +1062,10 @@ def deploy_enabled_mod_files(game_root: Path) -> list[str]:
 
     deployed: list[str] = []
 
+    # en scan per mapp; seten uppdateras när slots tas
+    used_assets = used_slots(assets_dir, ASSETS_PC_RE)
+    used_paks = used_slots(pak_dir, DATA_PAK_RE)
+
     for mod_root, manifest in enabled:
         raw_dir = mod_root / "raw"
         mod_name = manifest.get("name", mod_root.name)
@@ -832,36 +1074,40 @@ def deploy_enabled_mod_files(game_root: Path) -> list[str]:
             print(f"[DEPLOY] missing raw_dir for {mod_name}: {raw_dir}")
             continue
 
-        for src in raw_dir.rglob("*"):
-            if not src.is_file():
+        for entry in _iter_files(raw_dir):
+            src = entry.path
+            name = entry.name
+            low = name.lower()
+            _, dot, ext = low.rpartition(".")
+            if not dot:
                 continue
 
-            low = src.name.lower()
-
             try:
-                if low.endswith((".asi", ".dll")):
-                    dest = bin_dir / src.name
+                if ext in ("asi", "dll"):
+                    dest = bin_dir / name
                     shutil.copy2(src, dest)
                     deployed.append(str(dest))
                     continue
 
-                if low.endswith(".rpack") and "_pc" in low:
-                    slot = find_free_slot(assets_dir, ASSETS_PC_RE, 5)
+                if ext == "rpack" and "_pc" in low:
+                    slot = _first_free(used_assets, 5)
                     if slot is None:
                         print(f"[DEPLOY] assets slots full: {assets_dir}")
                         continue
                     dest = assets_dir / f"assets_{slot}_pc.rpack"
-                    shutil.copy2(src, dest)
+                    shutil.copyfile(src, dest)  # bara innehållet spelar roll; OS fast-copy utan copystat
+                    used_assets.add(slot)
                     deployed.append(str(dest))
                     continue
 
-                if re.match(r"^data\d+\.pak$", src.name, re.IGNORECASE):
-                    slot = find_free_slot(pak_dir, DATA_PAK_RE, 7)
+                if ext == "pak" and DATA_PAK_FILE_RE.match(name):
+                    slot = _first_free(used_paks, 7)
                     if slot is None:
                         print(f"[DEPLOY] pak slots full: {pak_dir}")
                         continue
                     dest = pak_dir / f"data{slot}.pak"
-                    shutil.copy2(src, dest)
+                    shutil.copyfile(src, dest)
+                    used_paks.add(slot)
                     deployed.append(str(dest))
                     continue
 
@@ -878,8 +1124,10 @@ def uninstall_installed_mod(mod_root: Path, manifest: dict):
     if not messagebox.askyesno("Remove mod?", f"Remove '{name}' from Installed Mods?\n\nThis deletes:\n{mod_root}"):
         return False
 
+    _MANIFEST_CACHE.pop(mod_root, None)
+    invalidate_mods_cache()
     try:
-        shutil.rmtree(mod_root, ignore_errors=False)
+        discard_dir(mod_root)
         return True
     except Exception as e:
         messagebox.showerror("Remove failed", str(e))
@@ -913,7 +1161,7 @@ def uninstall_installed_mod(mod_root: Path, manifest: dict):
         notes_txt = f"\nNotes: {notes}" if notes else ""
 
         # Länkvisning (valfritt)
-        url_txt = files_url(m["mod_id"], m.get("file_id"))
+        url_txt = m["url"]  # förberäknad i ensure_mod_urls
 
         details.config(
             text=f"Affects: {affects_txt}{notes_txt}\nLink: {url_txt}"
@@ -944,17 +1192,41 @@ def uninstall_installed_mod(mod_root: Path, manifest: dict):
     
     return frame
 
+def _installed_mod_entries() -> list:
+    # scandir: is_dir() kommer från readdir-datan; normcase = samma ordning som sorted(Path) gav
+    try:
+        with os.scandir(MODS_DIR) as it:
+            entries = [e for e in it if e.is_dir(follow_symlinks=False)]
+    except OSError:
+        return []
+    entries.sort(key=lambda e: os.path.normcase(e.name))
+    return entries
+
+# senaste list_installed_mods; sig = (namn, mtime_ns) per mod-mapp
+_MODS_CACHE = {"sig": None, "value": []}
+
+def invalidate_mods_cache():
+    _MODS_CACHE["sig"] = None
+
 def list_installed_mods() -> list[tuple[Path, dict]]:
+    entries = _installed_mod_entries()
+    try:
+        # DirEntry.stat() är gratis på Windows (kommer från readdir)
+        sig = tuple((e.name, e.stat(follow_symlinks=False).st_mtime_ns) for e in entries)
+    except OSError:
+        sig = None
+    if sig is not None and sig == _MODS_CACHE["sig"]:
+        return list(_MODS_CACHE["value"])
+
     mods = []
-    if not MODS_DIR.exists():
-        return mods
-    for mod_root in sorted(MODS_DIR.iterdir()):
-        if not mod_root.is_dir():
-            continue
+    for e in entries:
+        mod_root = Path(e.path)
         m = load_manifest(mod_root)
         if m:
             mods.append((mod_root, m))
-    return mods
+    _MODS_CACHE["sig"] = sig
+    _MODS_CACHE["value"] = mods
+    return list(mods)
     
 # Spawn patches have no effect in game v1.5+
 SPAWNS_SUPPORTED = False
@@ -1008,6 +1280,16 @@ COLOR_WARN = "#9f9f9f"
 COLOR_BORDER = "#111111"
 # Card border (Volatiles and other tabs) — use same for background and color so all cards match
 CARD_HIGHLIGHT = "#8A8A8A"
+# Muted hint text
+COL_MUTED = "#666666"
+
+# UI fonts (delas av alla flikar)
+FONT_TITLE = ("Arial", 12, "bold")
+FONT_H2 = ("Arial", 11, "bold")
+FONT_H3 = ("Arial", 10, "bold")
+FONT_SMALL = ("Arial", 8)
+FONT_BODY = ("Arial", 9)
+FONT_LABEL = ("Arial", 10)  # ui_labeled_slider titel
 
 # -----------------------------
 # Game pool constants
@@ -1108,6 +1390,7 @@ def make_scrollable(parent):
     canvas.bind("<Enter>", _bind)
     canvas.bind("<Leave>", _unbind)
 
+    outer._canvas = canvas  # direkt åtkomst för anropare (höjd m.m.)
     return outer, inner
 
 
@@ -1148,6 +1431,7 @@ def create_scrollable_frame(parent):
     canvas.bind("<Enter>", _bind)
     canvas.bind("<Leave>", _unbind)
 
+    outer._canvas = canvas  # direkt åtkomst för anropare (höjd m.m.)
     return outer, inner
 
 
@@ -1162,7 +1446,7 @@ def _fuel_color_bar_row(
     bar_width: int = 220,
     bar_height: int = 18,
 ):
-    """One row: label + clickable/draggable color bar + entry. Updates var; bar color from color_func(value)."""
+    """One row: label + clickable/draggable color bar + entry. Updates var; bar color from color_func(value) -> "#rrggbb"."""
     row = tk.Frame(parent)
     row.pack(fill="x", anchor="center", pady=(0, 4))
     tk.Label(row, text=label, font=("Arial", 9, "bold"), anchor="center", width=14).pack(side="left", padx=(0, 6))
@@ -1185,20 +1469,77 @@ def _fuel_color_bar_row(
     def update_bar(*_):
         val = var.get()
         val = max(vmin, min(vmax, val))
-        r, g, b = color_func(val)
-        hex_c = f"#{r:02x}{g:02x}{b:02x}"
+        hex_c = color_func(val)
         canvas.delete("bar")
         canvas.create_rectangle(1, 1, bar_width - 1, bar_height - 1, fill=hex_c, outline="#888", tags="bar")
 
+    # Drag skriver var ~100 ggr -> rita bara om en gång per idle-cykel (senaste värdet)
+    _pending = {"id": None}
+
+    def _flush():
+        _pending["id"] = None
+        update_bar()
+
+    def _schedule(*_):
+        if _pending["id"] is None:
+            _pending["id"] = canvas.after_idle(_flush)
+
     canvas = tk.Canvas(row, width=bar_width, height=bar_height, highlightthickness=0, borderwidth=1, relief="solid")
     canvas.pack(side="left", padx=(0, 6))
     canvas.bind("<Button-1>", set_from_event)
     canvas.bind("<B1-Motion>", set_from_event)
-    var.trace_add("write", update_bar)
+    var.trace_add("write", _schedule)
     entry = tk.Entry(row, width=5, textvariable=var)
     entry.pack(side="left")
     update_bar()
     return row
+
+
+def _fuel_usage_rgb(val):
+    # clamp 0..100
+    v = max(0.0, min(100.0, float(val)))
+    t = v / 100.0  # 0..1
+
+    # 0%  -> nästan grå men lite röd tint (svagast möjligt utan att bli osynlig)
+    r0, g0, b0 = 135, 125, 125
+    # 100% -> neutral grå (vanilla)
+    r1, g1, b1 = 145, 145, 145
+
+    r = int(r0 + (r1 - r0) * t)
+    g = int(g0 + (g1 - g0) * t)
+    b = int(b0 + (b1 - b0) * t)
+    return (r, g, b)
+
+
+def _fuel_max_rgb(val):
+    t = (val - 100) / 900.0 if val > 100 else 0.0
+    t = max(0, min(1, t))
+    if t < 0.4:
+        u = t / 0.4
+        r = int(128 * (1 - u))
+        g = int(128 * (1 - u))
+        b = int(128 + (255 - 128) * u)
+    else:
+        u = (t - 0.4) / 0.6
+        r = int(160 * u)
+        g = 0
+        b = 255
+    return (min(255, max(0, r)), min(255, max(0, g)), min(255, max(0, b)))
+
+
+# Färgerna räknas ut en gång vid import (slidrarna har fasta heltalssteg)
+FUEL_USAGE_LUT = ["#%02x%02x%02x" % _fuel_usage_rgb(v) for v in range(101)]
+FUEL_MAX_LUT = {v: "#%02x%02x%02x" % _fuel_max_rgb(v) for v in range(100, 1001, 10)}
+
+
+def fuel_usage_color(val):
+    return FUEL_USAGE_LUT[max(0, min(100, int(val)))]
+
+
+def fuel_max_color(val):
+    # Entry kan ge värden utanför 10-steg -> räkna direkt
+    hex_c = FUEL_MAX_LUT.get(val)
+    return hex_c if hex_c is not None else "#%02x%02x%02x" % _fuel_max_rgb(val)
     
 def pick_scale(ret):
     if hasattr(ret, "config"):
@@ -1233,13 +1574,11 @@ def find_scale(obj):
 
     return None
     
-def red_callout(parent, padx=0, pady=0):
-    """Returns (box_frame, inner_frame). box_frame has the red border; reconfigure it when path is set."""
-    box = tk.Frame(parent, highlightthickness=2, highlightbackground="#d00000")
-    box.pack(side="left", padx=0, pady=0)   
-    inner = tk.Frame(box)
-    inner.pack(padx=padx, pady=pady)        
-    return box, inner
+def red_callout(parent, padx=0, pady=0, **pack_kw):
+    """Returns one frame with the red border (padx/pady = inner padding); reconfigure it when path is set."""
+    box = tk.Frame(parent, highlightthickness=2, highlightbackground="#d00000", padx=padx, pady=pady)
+    box.pack(side="left", **pack_kw)
+    return box
   
 def resource_path(rel_path: str) -> str:
     # If PyInstaller onefile: sys._MEIPASS points to temp extraction dir
@@ -1254,7 +1593,7 @@ def resource_path(rel_path: str) -> str:
     return os.path.join(base_dir, rel_path)
 
 def config_dir() -> Path:
-    base = Path(os.environ.get("LOCALAPPDATA", str(Path.home() / "AppData" / "Local")))
+    base = Path(os.environ.get("LOCALAPPDATA", str(HOME / "AppData" / "Local")))
     p = base / APP_NAME
     p.mkdir(parents=True, exist_ok=True)
     return p
@@ -1284,7 +1623,57 @@ def looks_like_dltb_root(path: str) -> bool:
     return os.path.isdir(os.path.join(path, "ph_ft", "source"))
 
 
+DLTB_CANDIDATES_JSON = config_dir() / "dltb_candidates.json"
+DLTB_CANDIDATES_TTL_S = 3600.0
+_CANDIDATES_REFRESH = {"running": False}
+
+
+def _read_candidates_cache():
+    try:
+        data = json_loads_bytes(DLTB_CANDIDATES_JSON.read_bytes())
+        return float(data["ts"]), [str(p) for p in data["paths"]]
+    except Exception:
+        return None
+
+
+def _write_candidates_cache(paths):
+    tmp = str(DLTB_CANDIDATES_JSON) + ".tmp"
+    try:
+        with open(tmp, "wb") as f:
+            f.write(json_dumps_bytes({"ts": time.time(), "paths": paths}))
+        os.replace(tmp, DLTB_CANDIDATES_JSON)
+    except OSError as e:
+        print("dltb_candidates cache write ERROR:", e)
+
+
+def _refresh_candidates_cache():
+    try:
+        _write_candidates_cache(_scan_dltb_candidates())
+    finally:
+        _CANDIDATES_REFRESH["running"] = False
+
+
 def find_dltb_candidates_windows():
+    """
+    Cachad variant av _scan_dltb_candidates (config_dir()/dltb_candidates.json).
+    Gammal men giltig cache returneras direkt och förnyas i bakgrunden.
+    """
+    cached = _read_candidates_cache()
+    if cached is not None:
+        ts, paths = cached
+        if paths and looks_like_dltb_root(paths[0]):
+            if time.time() - ts >= DLTB_CANDIDATES_TTL_S and not _CANDIDATES_REFRESH["running"]:
+                _CANDIDATES_REFRESH["running"] = True
+                threading.Thread(target=_refresh_candidates_cache, daemon=True).start()
+            return paths
+
+    # ingen (användbar) cache -> skanna nu
+    paths = _scan_dltb_candidates()
+    _write_candidates_cache(paths)
+    return paths
+
+
+def _scan_dltb_candidates():
     """Try to find DLTB in common Steam/Epic folders. Returns list of paths."""
     candidates = []
 
@@ -1376,7 +1765,7 @@ def ui_keybind_row(parent, label_text: str, var: tk.StringVar, hint: str = ""):
     tk.Button(row, text="Bind…", command=_bind).pack(side="left", padx=(0, 10))
 
     if hint:
-        tk.Label(row, text=hint, fg="#666666", font=("Arial", 8)).pack(side="left")
+        tk.Label(row, text=hint, fg=COL_MUTED, font=FONT_SMALL).pack(side="left")
 
     return row
 
@@ -1437,8 +1826,8 @@ def capture_bind(root, target_var: tk.StringVar, title="Press a key"):
     win.grab_set()  # modal
     win.resizable(False, False)
 
-    tk.Label(win, text="Press a key or mouse button…", font=("Arial", 10, "bold")).pack(padx=14, pady=(12, 6))
-    tk.Label(win, text="(Esc cancels)", fg="#666666", font=("Arial", 9)).pack(padx=14, pady=(0, 12))
+    tk.Label(win, text="Press a key or mouse button…", font=FONT_H3).pack(padx=14, pady=(12, 6))
+    tk.Label(win, text="(Esc cancels)", fg=COL_MUTED, font=FONT_BODY).pack(padx=14, pady=(0, 12))
 
     def on_key(e):
         # Esc cancels
@@ -1460,82 +1849,89 @@ def capture_bind(root, target_var: tk.StringVar, title="Press a key"):
     # ensure it receives focus
     win.focus_force()
 
-    
+
+# Keybind-text -> input-token (delas av to_input_token, byggs en gång)
+INPUT_KEY_ALIASES = {
+    " ": "Space",
+    "Spacebar": "Space",
+    "comma": ",",
+    "COMMA": ",",
+    "Comma": ",",
+    "Esc": "Escape",
+    "PgUp": "PageUp",
+    "PgDn": "PageDown",
+    "Del": "Delete",
+    "Ins": "Insert",
+    "Caps": "CapsLock",
+    "LShift": "LeftShift",
+    "RShift": "RightShift",
+    "LCtrl": "LeftControl",
+    "RCtrl": "RightControl",
+    "LAlt": "LeftAlt",
+    "RAlt": "RightAlt",
+    "UpArrow": "Up",
+    "DownArrow": "Down",
+    "LeftArrow": "Left",
+    "RightArrow": "Right",
+}
+
+INPUT_MOUSE_MAP = {
+    "Mouse1": "EMouse__BUTTON_1",
+    "Mouse2": "EMouse__BUTTON_2",
+    "Mouse3": "EMouse__BUTTON_3",
+    "Mouse4": "EMouse__BUTTON_4",
+    "Mouse5": "EMouse__BUTTON_5",
+    "WheelUp": "EMouse__WHEEL_UP",
+    "WheelDown": "EMouse__WHEEL_DOWN",
+}
+
+INPUT_KEY_MAP = {
+    # arrows
+    "Up": "EKey__UP_",
+    "Down": "EKey__DOWN",
+    "Left": "EKey__LEFT",
+    "Right": "EKey__RIGHT",
+
+    # common
+    "Space": "EKey__SPACE_",
+    "CapsLock": "EKey__CAPITAL",
+    "Tab": "EKey__TAB",
+    "Enter": "EKey__RETURN",
+    "Escape": "EKey__ESCAPE",
+    "Backspace": "EKey__BACK",
+
+    # nav/edit (här kommer din Home)
+    "Home": "EKey__HOME",
+    "End": "EKey__END",
+    "PageUp": "EKey__PRIOR",     # ofta PageUp
+    "PageDown": "EKey__NEXT",    # ofta PageDown
+    "Insert": "EKey__INSERT",
+    ",": "EKey__COMMA",
+    "Delete": "EKey__DELETE",
+
+    # modifiers
+    "LeftShift": "EKey__LSHIFT",
+    "RightShift": "EKey__RSHIFT",
+    "LeftControl": "EKey__LCONTROL",
+    "RightControl": "EKey__RCONTROL",
+    "LeftAlt": "EKey__LMENU",
+    "RightAlt": "EKey__RMENU",
+}
+
+INPUT_KEYS_ALLOWED = sorted(list(INPUT_KEY_MAP.keys()) + ["A-Z", "0-9"] + list(INPUT_MOUSE_MAP.keys()))
+
+
+@functools.lru_cache(maxsize=128)
 def to_input_token(user_key: str) -> str:
+    """Keybind-text -> EKey__/EMouse__-token. Ren funktion -> cachad (samma tangenter återkommer varje build)."""
     k = (user_key or "").strip()
 
     # Normalisera lite
-    aliases = {
-        " ": "Space",
-        "Spacebar": "Space",
-        "comma": ",",
-        "COMMA": ",",
-        "Comma": ",",
-        "Esc": "Escape",
-        "PgUp": "PageUp",
-        "PgDn": "PageDown",
-        "Del": "Delete",
-        "Ins": "Insert",
-        "Caps": "CapsLock",
-        "LShift": "LeftShift",
-        "RShift": "RightShift",
-        "LCtrl": "LeftControl",
-        "RCtrl": "RightControl",
-        "LAlt": "LeftAlt",
-        "RAlt": "RightAlt",
-        "UpArrow": "Up",
-        "DownArrow": "Down",
-        "LeftArrow": "Left",
-        "RightArrow": "Right",
-    }
-    k = aliases.get(k, k)
+    k = INPUT_KEY_ALIASES.get(k, k)
 
     # Mouse
-    mouse_map = {
-        "Mouse1": "EMouse__BUTTON_1",
-        "Mouse2": "EMouse__BUTTON_2",
-        "Mouse3": "EMouse__BUTTON_3",
-        "Mouse4": "EMouse__BUTTON_4",
-        "Mouse5": "EMouse__BUTTON_5",
-        "WheelUp": "EMouse__WHEEL_UP",
-        "WheelDown": "EMouse__WHEEL_DOWN",
-    }
-    if k in mouse_map:
-        return mouse_map[k]
-
-    # Keyboard
-    key_map = {
-        # arrows
-        "Up": "EKey__UP_",
-        "Down": "EKey__DOWN",
-        "Left": "EKey__LEFT",
-        "Right": "EKey__RIGHT",
-
-        # common
-        "Space": "EKey__SPACE_",
-        "CapsLock": "EKey__CAPITAL",
-        "Tab": "EKey__TAB",
-        "Enter": "EKey__RETURN",
-        "Escape": "EKey__ESCAPE",
-        "Backspace": "EKey__BACK",
-
-        # nav/edit (här kommer din Home)
-        "Home": "EKey__HOME",
-        "End": "EKey__END",
-        "PageUp": "EKey__PRIOR",     # ofta PageUp
-        "PageDown": "EKey__NEXT",    # ofta PageDown
-        "Insert": "EKey__INSERT",
-        ",": "EKey__COMMA",
-        "Delete": "EKey__DELETE",
-
-        # modifiers
-        "LeftShift": "EKey__LSHIFT",
-        "RightShift": "EKey__RSHIFT",
-        "LeftControl": "EKey__LCONTROL",
-        "RightControl": "EKey__RCONTROL",
-        "LeftAlt": "EKey__LMENU",
-        "RightAlt": "EKey__RMENU",
-    }
+    if k in INPUT_MOUSE_MAP:
+        return INPUT_MOUSE_MAP[k]
 
     # A–Z
     if len(k) == 1 and k.isalpha():
@@ -1545,21 +1941,82 @@ def to_input_token(user_key: str) -> str:
     if len(k) == 1 and k.isdigit():
         return f"EKey__{k}"
 
-    if k in key_map:
-        return key_map[k]
+    if k in INPUT_KEY_MAP:
+        return INPUT_KEY_MAP[k]
 
-    allowed = sorted(list(key_map.keys()) + ["A-Z", "0-9"] + list(mouse_map.keys()))
+    allowed = INPUT_KEYS_ALLOWED
     raise Exception(f"Unknown key '{user_key}'. Try: " + ", ".join(allowed[:25]) + ("..." if len(allowed) > 25 else ""))
     
 
 def app_data_dir() -> Path:
-    base = Path(os.environ.get("LOCALAPPDATA", Path.home() / "AppData" / "Local"))
+    base = Path(os.environ.get("LOCALAPPDATA", HOME / "AppData" / "Local"))
     d = base / "DLTB Configurator"
     d.mkdir(parents=True, exist_ok=True)
     return d
 
 BACKUPS_DIR = app_data_dir() / "player_backup_saves"
-BACKUPS_DIR.mkdir(parents=True, exist_ok=True)
+_BACKUPS_DIR_READY = [False]
+
+
+def ensure_backups_dir() -> None:
+    # en mkdir per process (copytree skapar ändå dst + föräldrar om mappen tagits bort)
+    if _BACKUPS_DIR_READY[0]:
+        return
+    BACKUPS_DIR.mkdir(parents=True, exist_ok=True)
+    _BACKUPS_DIR_READY[0] = True
+
+
+ensure_backups_dir()
+
+
+def _latest_save_backup() -> Path | None:
+    backups = sorted(BACKUPS_DIR.glob("save_backup_*"))
+    return backups[-1] if backups else None
+
+
+def _robocopy_tree(src: Path, dst: Path) -> bool:
+    try:
+        r = subprocess.run(
+            ["robocopy", str(src), str(dst), "/E", "/MT:8", "/NFL", "/NDL", "/NJH", "/NJS", "/NP"],
+            capture_output=True,
+            creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
+            check=False,
+        )
+    except OSError:
+        return False
+    # robocopy: 0-7 = ok, >= 8 = fel
+    if r.returncode < 8:
+        return True
+    shutil.rmtree(dst, ignore_errors=True)
+    return False
+
+
+def copy_save_backup(src: Path, dst: Path) -> None:
+    """
+    copytree src -> dst, men filer som är oförändrade sedan förra backupen
+    (samma storlek + mtime, copy2 behåller mtime) hårdlänkas istället för att kopieras.
+    """
+    prev = _latest_save_backup()
+    if prev is None or not prev.is_dir():
+        # första (fulla) backupen: robocopy /MT kopierar parallellt och behåller tidsstämplar
+        if sys.platform.startswith("win") and _robocopy_tree(src, dst):
+            return
+        shutil.copytree(src, dst)
+        return
+
+    def _copy(src_file, dst_file):
+        rel = os.path.relpath(src_file, src)
+        old = prev / rel
+        try:
+            st, st_old = os.stat(src_file), os.stat(old)
+            if st.st_size == st_old.st_size and st.st_mtime_ns == st_old.st_mtime_ns:
+                os.link(old, dst_file)
+                return dst_file
+        except OSError:
+            pass  # saknas i förra backupen / annan volym -> vanlig kopia
+        return shutil.copy2(src_file, dst_file)
+
+    shutil.copytree(src, dst, copy_function=_copy)
 
         
 def add_banner(parent, image_path, height=160):
@@ -1642,30 +2099,67 @@ def app_dir() -> Path:
     # Där exe:n ligger när du kör PyInstaller, annars där .py ligger
     if getattr(sys, "frozen", False):
         return Path(sys.executable).parent
-    return Path(__file__).resolve().parent
+    return APP_ROOT
     
+# auto-detect skannar diskar/Steam-bibliotek -> återanvänd träffen en kort stund (dubbelklick m.m.)
+AUTO_DETECT_TTL_S = 30.0
+_AUTO_DETECT_CACHE = {"path": None, "t": 0.0}
+
+
 def auto_detect_game_folder():
+    path = _AUTO_DETECT_CACHE["path"]
+    if path and time.monotonic() - _AUTO_DETECT_CACHE["t"] < AUTO_DETECT_TTL_S and os.path.isdir(path):
+        return path
     cands = find_dltb_candidates_windows()
     if not cands:
         raise Exception("Could not auto-detect game folder. Select manually.")
+    _AUTO_DETECT_CACHE["path"] = cands[0]
+    _AUTO_DETECT_CACHE["t"] = time.monotonic()
     return cands[0]
 
 
+def forget_auto_detected_game_folder():
+    _AUTO_DETECT_CACHE["path"] = None
+
+
+# senast skrivna/lästa game_path.txt-värde -> skriv bara när det faktiskt ändras
+_SAVED_GAME_PATH = [None]
+
+
 def save_game_path(path):
+    if path == _SAVED_GAME_PATH[0]:
+        return
     with open("game_path.txt", "w", encoding="utf-8") as f:
         f.write(path)
+    _SAVED_GAME_PATH[0] = path
 
 
 def load_game_path():
-    if os.path.exists("game_path.txt"):
+    try:
         with open("game_path.txt", "r", encoding="utf-8") as f:
-            return f.read().strip()
-    return ""
+            path = f.read().strip()
+    except FileNotFoundError:
+        return ""
+    _SAVED_GAME_PATH[0] = path
+    return path
 
 
 PRESET_SCHEMA_VERSION = 1
 
 
+def preset_write(path, data) -> None:
+    # skriv till .tmp och byt atomiskt -> ingen halvskriven preset vid krasch
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(json_dumps_bytes(data))
+    os.replace(tmp, path)
+
+
+def preset_read(path):
+    with open(path, "rb") as f:
+        return json_loads_bytes(f.read())
+
+
 def preset_dump(preset_vars):
     data = {"_schema": PRESET_SCHEMA_VERSION}
     for key, var in preset_vars:
@@ -1737,6 +2231,19 @@ def ensure_dirs():
     os.makedirs("scripts", exist_ok=True)
 
 
+def write_status(widget, parts) -> None:
+    """Skriv [(text, tag), ...] till status-Text: ett insert-anrop, och inget alls om samma som nu."""
+    parts = tuple((str(text), tag) for text, tag in parts)
+    if getattr(widget, "_last_status", None) == parts:
+        return
+    widget._last_status = parts
+    widget.config(state="normal")
+    widget.delete("1.0", "end")
+    if parts:
+        widget.insert("end", *(x for part in parts for x in part))
+    widget.config(state="disabled")
+
+
 def disable_children(widget: tk.Widget) -> None:
     """Recursively disable all children (ttk: state disabled, tk: state=disabled)."""
     for child in widget.winfo_children():
@@ -1756,15 +2263,25 @@ def disable_children(widget: tk.Widget) -> None:
         disable_children(child)
 
 
-def clear_scripts():
-    # remove generated scripts only
-    for folder in ("scripts/player", "scripts/progression",):
-        if os.path.exists(folder):
-            for f in os.listdir(folder):
-                try:
-                    os.remove(os.path.join(folder, f))
-                except Exception:
-                    pass
+# utfiler som write_from_template skrivit denna session (scripts/ töms vid start)
+_GENERATED_SCRIPTS: set = set()
+# utfiler som hör till pågående bygge
+_BUILD_SCRIPTS: set = set()
+
+
+def begin_scripts_build():
+    _BUILD_SCRIPTS.clear()
+
+
+def remove_stale_scripts():
+    # efter alla write_*: ta bort våra gamla utfiler som inte hör till detta bygge
+    # -> inga gamla skript i paken, utan rmtree och utan att skriva om oförändrade filer
+    for path in _GENERATED_SCRIPTS - _BUILD_SCRIPTS:
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+    _GENERATED_SCRIPTS.intersection_update(_BUILD_SCRIPTS)
 
 
 # -----------------------------
@@ -1784,14 +2301,29 @@ def apply_patchers(content: str, patchers: List[Patcher]) -> str:
         content = patch(content)
     return content
     
-def patch_disable_layout_keybinding_for_action(action_name: str):
+def _noop_patcher(content: str) -> str:
+    return content
+
+
+# invarianta regexar kompileras en gång; action-specifika cachas per namn/tuple
+_LAYOUT_BLOCK_PAT = re.compile(r'(?s)(?P<block>LayoutKeybinding\(".*?"\s*,.*?\)\s*\{.*?\})')
+
+
+@functools.lru_cache(maxsize=128)
+def _layout_action_pat(action_names: tuple):
+    alts = "|".join(re.escape(a) for a in action_names)
+    return re.compile(rf'(?m)^\s*Action\(\s*(?:{alts})\s*\)\s*;\s*$')
+
+
+def patch_disable_layout_keybindings_for_actions(action_names: Iterable[str]) -> Patcher:
     """
-    Comment out LayoutKeybinding(...) { ... } blocks that contain Action(action_name);
+    Comment out every LayoutKeybinding(...) { ... } block that contains Action(<any of action_names>);
+    one regex pass for all actions.
     """
+    action_names = tuple(sorted(action_names))
     # Match LayoutKeybinding-block
-    block_pat = re.compile(r'(?s)(?P<block>LayoutKeybinding\(".*?"\s*,.*?\)\s*\{.*?\})')
-
-    action_pat = re.compile(rf'(?m)^\s*Action\(\s*{re.escape(action_name)}\s*\)\s*;\s*$')
+    block_pat = _LAYOUT_BLOCK_PAT
+    action_pat = _layout_action_pat(action_names)
 
     def _comment_block(block: str) -> str:
         # Comment each line with //
@@ -1799,54 +2331,81 @@ def patch_disable_layout_keybinding_for_action(action_name: str):
                          for line in block.splitlines())
 
     def _patch(content: str) -> str:
-        changed = False
-
         def repl(m: re.Match) -> str:
-            nonlocal changed
             block = m.group("block")
             if action_pat.search(block):
-                changed = True
                 return _comment_block(block)
             return block
 
-        out = block_pat.sub(repl, content)
-        if not changed:
-
-            return out
-        return out
+        return block_pat.sub(repl, content)
 
+    # consolidate_patchers slår ihop intilliggande till ett enda pass
+    _patch.layout_actions = action_names
     return _patch
 
 
+def patch_disable_layout_keybinding_for_action(action_name: str):
+    """
+    Comment out LayoutKeybinding(...) { ... } blocks that contain Action(action_name);
+    """
+    return patch_disable_layout_keybindings_for_actions((action_name,))
+
+
+def consolidate_patchers(patchers: List[Patcher]) -> List[Patcher]:
+    """
+    Merge pass over one file's patchers: drops no-op patchers and merges
+    consecutive LayoutKeybinding-disables into a single regex pass.
+    """
+    out: List[Patcher] = []
+    run: List[Patcher] = []
+
+    def _flush_run() -> None:
+        if len(run) == 1:
+            out.append(run[0])
+        elif run:
+            out.append(patch_disable_layout_keybindings_for_actions(
+                a for r in run for a in r.layout_actions
+            ))
+        run.clear()
+
+    for p in patchers:
+        if p is _noop_patcher:
+            continue
+        if hasattr(p, "layout_actions"):
+            run.append(p)
+            continue
+        _flush_run()
+        out.append(p)
+    _flush_run()
+    return out
+
+
+# MULTILINE + [ \t]* håller matchningen på en rad; "//"-rader matchar aldrig
+_VOLATILE_POOL_PAT = re.compile(r'^[ \t]*Pool\(\s*"([^"]+)"\s*\)', re.MULTILINE)
+_VOLATILE_WEIGHTED_PAT = re.compile(
+    r'^(?P<indent>[ \t]*)PresetWeighted\(\s*"(?P<preset>Character;Volatile[^"]*)"\s*,\s*(?P<num>\d+)\s*\)(?P<tail>.*)$',
+    re.MULTILINE,
+)
+
+
 def patch_volatile_weights_scale_for_pools(
     *, pct: int, pools: Iterable[str], min_weight: int = 2
 ) -> Patcher:
     pct = int(pct)
     pools_set: Set[str] = set(pools)
 
-    pool_pat = re.compile(r'^\s*Pool\(\s*"([^"]+)"\s*\)')
-    weighted_pat = re.compile(
-        r'^(?P<indent>\s*)PresetWeighted\(\s*"(?P<preset>Character;Volatile[^"]*)"\s*,\s*(?P<num>\d+)\s*\)(?P<tail>.*)$'
-    )
-
     def _patch(content: str) -> str:
-        out = []
-        current_pool = ""
-
-        for line in content.splitlines(keepends=True):
-            # hoppa över kommenterade rader
-            if line.lstrip().startswith("//"):
-                out.append(line)
-                continue
-
-            pm = pool_pat.match(line)
-            if pm:
-                current_pool = pm.group(1)
+        # pool-starter en gång; varje PresetWeighted hör till närmast föregående Pool(...)
+        pool_starts = []
+        pool_hit = []
+        for pm in _VOLATILE_POOL_PAT.finditer(content):
+            pool_starts.append(pm.start())
+            pool_hit.append(pm.group(1) in pools_set)
 
-            m = weighted_pat.match(line)
-            if not m or current_pool not in pools_set:
-                out.append(line)
-                continue
+        def repl(m: re.Match) -> str:
+            i = bisect.bisect_right(pool_starts, m.start()) - 1
+            if i < 0 or not pool_hit[i]:
+                return m.group(0)
 
             old = int(m.group("num"))
             new = int(round(old * (pct / 100.0)))
@@ -1854,15 +2413,24 @@ def patch_volatile_weights_scale_for_pools(
             if new < min_weight:
                 new = min_weight
 
-            if new != old:
-                line = f'{m.group("indent")}PresetWeighted("{m.group("preset")}", {new}){m.group("tail")}'
-
-            out.append(line)
+            if new == old:
+                return m.group(0)
+            return f'{m.group("indent")}PresetWeighted("{m.group("preset")}", {new}){m.group("tail")}'
 
-        return "".join(out)
+        return _VOLATILE_WEIGHTED_PAT.sub(repl, content)
 
     return _patch
 
+@functools.lru_cache(maxsize=128)
+def _addaction_pat(action_name: str):
+    return re.compile(
+        rf'(?m)^(?P<indent>\s*)AddAction\(\s*{re.escape(action_name)}\s*,'
+        r'(?P<rest>.*?EInputDevice_)(?P<device>Keyboard|Mouse)(?P<mid>.*?,\s*)'
+        r'(?P<key>EKey__\w+_?|EMouse__\w+)(?P<afterkey>.*?\)\s*)'
+        r'(?P<tail>;?\s*(\{.*\})?\s*)$'
+    )
+
+
 def patch_addaction_device_and_key(action_name: str, token: str):
     """
     token: "EKey__F" eller "EMouse__BUTTON_3"
@@ -1870,12 +2438,7 @@ def patch_addaction_device_and_key(action_name: str, token: str):
     is_mouse = token.startswith("EMouse__")
     new_device = "Mouse" if is_mouse else "Keyboard"
 
-    pat = re.compile(
-        rf'(?m)^(?P<indent>\s*)AddAction\(\s*{re.escape(action_name)}\s*,'
-        r'(?P<rest>.*?EInputDevice_)(?P<device>Keyboard|Mouse)(?P<mid>.*?,\s*)'
-        r'(?P<key>EKey__\w+_?|EMouse__\w+)(?P<afterkey>.*?\)\s*)'
-        r'(?P<tail>;?\s*(\{.*\})?\s*)$'
-    )
+    pat = _addaction_pat(action_name)
 
     def _patch(content: str) -> str:
         if not pat.search(content):
@@ -1907,7 +2470,7 @@ def patch_paramfloat_mul(name: str, mul: float) -> Patcher:
     Strict no-op: if mul == 1.0, returns identity patcher (do not patch).
     """
     if abs(mul - 1.0) < 1e-9:
-        return lambda c: c
+        return _noop_patcher
     pat = re.compile(
         rf'(?m)^(\s*ParamFloat\("{re.escape(name)}",\s*)([0-9.]+)(\).*)$'
     )
@@ -1976,7 +2539,7 @@ def patch_volatile_damage_bonus(
     bonus_nightmare_pct: int,
 ) -> Patcher:
     if bonus_easy_pct == 0 and bonus_normal_pct == 0 and bonus_hard_pct == 0 and bonus_nightmare_pct == 0:
-        return lambda c: c  # strict no-op
+        return _noop_patcher  # strict no-op
 
     factors = {
         "Easy": 1.0 + bonus_easy_pct / 100.0,
@@ -2034,7 +2597,7 @@ def patch_human_health_bonus(
 ) -> Patcher:
     # 100% = vanilla (no-op). 10% = 0.1x, 500% = 5.0x (multiplier = pct/100)
     if bonus_easy_pct == 100 and bonus_normal_pct == 100 and bonus_hard_pct == 100 and bonus_nightmare_pct == 100:
-        return lambda c: c  # strict no-op
+        return _noop_patcher  # strict no-op
 
     factors = {
         "Easy": bonus_easy_pct / 100.0,
@@ -2100,7 +2663,7 @@ def patch_enemy_tag_health_multipliers(
 ) -> Patcher:
     """Scale MaxHealthMultiplier(Difficulty, tier, value) inside Tag(tag_name) by pct/100. No-op if all 100."""
     if easy_pct == 100 and normal_pct == 100 and hard_pct == 100 and nm_pct == 100:
-        return lambda c: c
+        return _noop_patcher
     factors = {
         "Easy": easy_pct / 100.0,
         "Normal": normal_pct / 100.0,
@@ -2427,7 +2990,12 @@ def patch_delete_aipresetpool_pools(names: Tuple[str, ...]) -> Patcher:
 
         return content
 
-    return _patch
+    return _patch
+
+
+_NIGHT_POOL_LINE_RE = re.compile(r'^\s*Pool\(\s*"([^"]+)"\s*\)\s*$')
+_NIGHT_CAP_RE = re.compile(r"^(\s*)MaxNoZombiesInPursuit\(\s*(\d+)\s*\)\s*$")
+_OLD_TOWN_RE = re.compile(r'AllowedMaps\s*\(\s*"Old_Town"\s*\)')
 
 
 def patch_night_pursuit_caps(pool_to_cap: dict[str, int]) -> Patcher:
@@ -2441,9 +3009,9 @@ def patch_night_pursuit_caps(pool_to_cap: dict[str, int]) -> Patcher:
         replaced_in_this_pool = False
         in_old_town = False
 
-        pool_re = re.compile(r'^\s*Pool\(\s*"([^"]+)"\s*\)\s*$')
-        cap_re = re.compile(r"^(\s*)MaxNoZombiesInPursuit\(\s*(\d+)\s*\)\s*$")
-        allowed_ot_re = re.compile(r'AllowedMaps\s*\(\s*"Old_Town"\s*\)')
+        pool_re = _NIGHT_POOL_LINE_RE
+        cap_re = _NIGHT_CAP_RE
+        allowed_ot_re = _OLD_TOWN_RE
 
         for line in lines:
             # Detect pool start line: Pool("NAME")
@@ -2791,15 +3359,37 @@ def patch_hunger_buckets(
 
     return _patch
 
+@functools.lru_cache(maxsize=64)
+def _load_template_raw(template_path: str, mtime_ns: int) -> str:
+    # mtime_ns ingår i nyckeln -> ändrad template läses om
+    with open(template_path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def load_template(template_path: str) -> str:
+    return _load_template_raw(template_path, os.stat(template_path).st_mtime_ns)
+
+
 def write_from_template(template_rel_path: str, out_path: str, patchers):
     template_path = resource_path(template_rel_path)  # <-- VIKTIGT
 
-    with open(template_path, "r", encoding="utf-8") as f:
-        content = f.read()
+    content = load_template(template_path)
 
-    for p in patchers:
+    for p in consolidate_patchers(patchers):
         content = p(content)
 
+    out_key = os.path.normpath(out_path)
+    _GENERATED_SCRIPTS.add(out_key)
+    _BUILD_SCRIPTS.add(out_key)
+
+    # samma innehåll som redan ligger på disk -> skriv inte om filen
+    try:
+        with open(out_path, "r", encoding="utf-8", newline="") as f:
+            if f.read() == content:
+                return
+    except (OSError, UnicodeDecodeError):
+        pass
+
     os.makedirs(os.path.dirname(out_path), exist_ok=True)
 
     with open(out_path, "w", encoding="utf-8", newline="\n") as f:
@@ -3308,6 +3898,21 @@ def write_fuel_params(template_path: str, out_path: str, patchers: List[Patcher]
     write_from_template(template_path, out_path, patchers)
 
 
+# samma fuel-patchers på alla tre buggy-skript
+FUEL_PARAM_FILES = (
+    ("templates/buggy_defender_fuel_params.scr", "scripts/vehicles/buggy_defender_fuel_params.scr"),
+    ("templates/buggy_madriders_fuel_params.scr", "scripts/vehicles/buggy_madriders_fuel_params.scr"),
+    ("templates/buggy_wasteland_fuel_params.scr", "scripts/vehicles/buggy_wasteland_fuel_params.scr"),
+)
+
+
+def write_fuel_params_many(outputs, patchers: List[Patcher]) -> None:
+    # patcher-listan slås ihop en gång och återanvänds för varje (template, out)
+    patchers = consolidate_patchers(patchers)
+    for template_path, out_path in outputs:
+        write_from_template(template_path, out_path, patchers)
+
+
 def write_player_variables(patchers: List[Patcher]) -> None:
     write_from_template(
         "templates/player_variables.scr",
@@ -3499,7 +4104,7 @@ def patch_volatile_health_multipliers(
     """Patch healthdefinitions.scr: scale Volatile/Hive/Apex health values by percent.
     Strict no-op when all pct == 100."""
     if volatile_pct == 100 and hive_pct == 100 and apex_pct == 100:
-        return lambda c: c  # strict no-op
+        return _noop_patcher  # strict no-op
 
     def _mult_for(name: str) -> float | None:
         if name.startswith("Volatile_Hive_"):
@@ -3535,11 +4140,13 @@ def patch_volatile_health_multipliers(
         except ValueError:
             return None
 
+    # Match Health("NAME") { blocks only; exclude inner Health("VALUE");
+    block_pat = re.compile(
+        r'[ \t]+Health\("([^"]+)"\)(?!\s*;)[^{]*\{', re.MULTILINE
+    )
+    inner_pat = re.compile(r'Health\("([^"]*)"\)')
+
     def _patch(content: str) -> str:
-        # Match Health("NAME") { blocks only; exclude inner Health("VALUE");
-        block_pat = re.compile(
-            r'[ \t]+Health\("([^"]+)"\)(?!\s*;)[^{]*\{', re.MULTILINE
-        )
         result = []
         pos = 0
         for m in block_pat.finditer(content):
@@ -3558,7 +4165,6 @@ def patch_volatile_health_multipliers(
                     depth -= 1
                 i += 1
             block = content[brace + 1 : i - 1]
-            inner_pat = re.compile(r'Health\("([^"]*)"\)')
             def repl(mo: re.Match) -> str:
                 s = _scale_val(mo.group(1), factor)
                 return f'Health("{s}")' if s is not None else mo.group(0)
@@ -3581,7 +4187,7 @@ def patch_vehicle_health(
     """Patch healthdefinitions.scr: scale Vehicle_Pickup and Vehicle_Pickup_CTB health.
     Defaults: Vehicle_Pickup 1150, Vehicle_Pickup_CTB 2000. 100% = strict no-op."""
     if vehicle_pickup_pct == 100 and vehicle_pickup_ctb_pct == 100:
-        return lambda c: c
+        return _noop_patcher
 
     VANILLA = {"Vehicle_Pickup": 1150, "Vehicle_Pickup_CTB": 2000}
 
@@ -3734,7 +4340,7 @@ def patch_player_movement_speed(
 ) -> Patcher:
     """Scale movement Params in player_variables.scr. No-op if all 0."""
     if water_pct == 0 and land_pct == 0 and boost_pct == 0:
-        return lambda c: c
+        return _noop_patcher
 
     water_factor = 1.0 + water_pct / 100.0
     land_factor = 1.0 + land_pct / 100.0
@@ -3831,9 +4437,9 @@ def patch_ai_spawn_system(
         and not boost_darkzones
     ):
         if auto_cache:
-            return lambda c: c  # spawn 80 -> cache 200
+            return _noop_patcher  # spawn 80 -> cache 200
         if manual_cache == 200:
-            return lambda c: c  # don't touch, vanilla
+            return _noop_patcher  # don't touch, vanilla
     debug_limit = dialog_limit * 2
     if auto_cache:
         cache = max(200, round(200 + (max_spawned_ai - 80) * 1300 / 720))
@@ -3881,7 +4487,7 @@ def patch_player_climb_options(
 ) -> Patcher:
     """Set LadderClimbSlow and FastClimbEnabled in player_variables.scr. No-op when both unchecked (vanilla)."""
     if not ladder_climb_slow and not fast_climb_enabled:
-        return lambda c: c
+        return _noop_patcher
 
     ladder_val = "false" if ladder_climb_slow else "true"
     fast_val = "true" if fast_climb_enabled else "false"
@@ -4029,7 +4635,7 @@ def patch_common_dynamic_spawn_logic(
     """Patch common_dynamic_spawn_logic_params.def with spawn logic params. no_op=True for strict 0-diff."""
 
     if no_op:
-        return lambda c: c
+        return _noop_patcher
 
     def _patch(content: str) -> str:
         content = patch_param_value_optional(
@@ -4055,42 +4661,78 @@ def patch_common_dynamic_spawn_logic(
 # -----------------------------
 # 4) Build/install pipeline
 # -----------------------------
-def apply_enabled_mods_to_scripts(out_scripts_dir: Path):
-    enabled = get_enabled_mods()
-    if not enabled:
-        return
+# (writer, PatcherBundle-fält, skrivs även utan patchers)
+WRITE_STEPS = (
+    (write_player_variables, "player", True),
+    (write_ai_difficulty_modifiers, "ai_difficulty", True),
+    (write_healthdefinitions, "healthdefinitions", True),
+    (write_inputs_keyboard, "inputs_keyboard", True),
+    (functools.partial(write_fuel_params_many, FUEL_PARAM_FILES), "fuel", True),
+    (write_progression_actions, "prog", False),
+    (write_inventory_special, "inv", False),
+    (write_varlist_game_overlay, "overlay", False),
+    (write_player_hunger_config, "hunger", False),
+    (write_player_nightspawn_config, "night", False),
+    (write_player_volatiles_config, "volatiles", False),
+    (write_aipresetpool_config, "aipresetpool", False),
+)
+SPAWN_WRITE_STEPS = (
+    (write_ai_spawn_priority_system, "ai_spawn_priority", True),
+    (write_ai_spawn_system_params, "ai_spawn_system", True),
+    (write_common_dynamic_spawn_logic, "spawn_logic", False),
+    (write_densitiessettings, "densitiessettings", True),
+)
 
-    for mod_root, manifest in enabled:
-        # exempel: merge player_variables.scr om den finns
-        target_name = "player_variables.scr"
-        mod_file = find_mod_file(mod_root, target_name)
-        out_file = out_scripts_dir / target_name
 
-        if mod_file and out_file.exists():
-            config_text = out_file.read_text(encoding="utf-8", errors="ignore")
-            mod_text = mod_file.read_text(encoding="utf-8", errors="ignore")
+def write_jobs_for(pb: PatcherBundle):
+    """(writer, patchers) för allt som ska skrivas i detta bygge."""
+    steps = WRITE_STEPS + SPAWN_WRITE_STEPS if SPAWNS_SUPPORTED else WRITE_STEPS
+    jobs = []
+    for writer, field_name, always in steps:
+        patchers = getattr(pb, field_name)
+        if always or patchers:
+            jobs.append((writer, patchers))
+    return jobs
 
-            # policy: fråga? eller default config_wins?
-            # börja enkelt: config wins som default
-            mod_wins = False
 
-            merged, conflicts = merge_scr(config_text, mod_text, mod_wins)
-            if conflicts:
-                # här kan du senare popup + remember choice i manifest["priority"][target_name]
-                pass
+def _scripts_digest() -> str:
+    # hash över (relativ sökväg, innehåll) för allt som hamnar i paken
+    h = hashlib.blake2b(digest_size=16)
+    for root_dir, dirs, files in os.walk("scripts"):
+        dirs.sort()
+        for file in sorted(files):
+            full_path = os.path.join(root_dir, file)
+            h.update(full_path.replace(os.sep, "/").encode("utf-8") + b"\0")
+            with open(full_path, "rb") as f:
+                h.update(f.read())
+    return h.hexdigest()
 
-            out_file.write_text(merged, encoding="utf-8")
 
 def build_pak(pak_name=PAK_NAME):
     ensure_dirs()
     pak_path = os.path.join(OUTPUT_DIR, pak_name)
+    hash_path = pak_path + ".hash"
+
+    # samma skript som förra bygget -> befintlig pak är redan rätt
+    digest = _scripts_digest()
+    if os.path.isfile(pak_path):
+        try:
+            with open(hash_path, "r", encoding="utf-8") as f:
+                if f.read().strip() == digest:
+                    return pak_path
+        except OSError:
+            pass
 
-    with zipfile.ZipFile(pak_path, "w", zipfile.ZIP_STORED) as pak:
+    with zipfile.ZipFile(pak_path, "w", PAK_COMPRESSION) as pak:
         for root_dir, dirs, files in os.walk("scripts"):
-            for file in files:
+            dirs.sort()
+            for file in sorted(files):
                 full_path = os.path.join(root_dir, file)
                 pak.write(full_path, full_path)
 
+    with open(hash_path, "w", encoding="utf-8") as f:
+        f.write(digest)
+
     return pak_path
 
 
@@ -4139,7 +4781,13 @@ def set_default(group_list, var, value):
 
 
 def reset_defaults(group_list):
+    # Skriv bara vars som faktiskt skiljer sig -> inga trace-kaskader (mark_dirty, sliders) för oförändrade värden
     for var, value in group_list:
+        try:
+            if var.get() == value:
+                continue
+        except (tk.TclError, ValueError):
+            pass  # tomt/ogiltigt fält -> skriv default
         var.set(value)
 
 
@@ -4162,6 +4810,123 @@ ALPHA_MODE_OPTIONS = [
     ("Pacify (delete blocks)", "pacify"),
 ]
 
+# Label <-> value för dropdowns (statiska, byggs en gång)
+VO_MODE_LABELS = [label for (label, _value) in VO_MODE_OPTIONS]
+VO_LABEL_TO_VALUE = dict(VO_MODE_OPTIONS)
+VO_VALUE_TO_LABEL = {value: label for (label, value) in VO_MODE_OPTIONS}
+
+ALPHA_MODE_LABELS = [label for (label, _value) in ALPHA_MODE_OPTIONS]
+ALPHA_LABEL_TO_VALUE = dict(ALPHA_MODE_OPTIONS)
+ALPHA_VALUE_TO_LABEL = {value: label for (label, value) in ALPHA_MODE_OPTIONS}
+
+# Mode -> patcher-byggare (None = ingen patch). Okänt mode -> perception-profil
+def _mode_no_patch(_mode):
+    return None
+
+
+def _alpha_pacify(_mode):
+    return patch_delete_perception_profiles(
+        names=("volatile_apex", "volatile_apex_nightmare"),
+        exclude_names=("volatile_aiden",),
+    )
+
+
+def _alpha_profile(mode):
+    return patch_ai_perception_profiles(
+        target_prefixes=("volatile_apex",),
+        mode=mode,
+        resting_profile="volatile_hive_resting",
+        exclude_names=("volatile_aiden",),
+    )
+
+
+def _vo_pacify(_mode):
+    return patch_delete_perception_profiles(
+        names=(
+            "volatile_default",
+            "volatile_patrol_nightmare",
+            "volatile_patrol",
+            "volatile_nightmare",
+            "volatile_chase",
+            "volatile_chase_nightmare",
+            "volatile_sun_immune",
+        ),
+        exclude_names=(
+            "volatile_aiden",
+            "volatile_stinger",
+            "volatile_hive_default",
+            "volatile_hive_mq06",
+            "volatile_hive_nightmare",
+            "volatile_summoner_default",
+            "volatile_summoner_nightmare",
+            "alpha_zombie_default",
+        ),
+    )
+
+
+def _vo_profile(mode):
+    return patch_ai_perception_profiles(
+        target_prefixes=("volatile_",),
+        mode=mode,
+        resting_profile="volatile_hive_resting",
+        exclude_names=(
+            "volatile_aiden",
+            "volatile_stinger",
+            "volatile_hive_default",
+        ),
+    )
+
+
+ALPHA_MODE_BUILDERS = {"vanilla": _mode_no_patch, "none": _mode_no_patch, "pacify": _alpha_pacify}
+VO_MODE_BUILDERS = {"vanilla": _mode_no_patch, "none": _mode_no_patch, "pacify": _vo_pacify}
+
+# Fordons-actions i inputs_keyboard.scr -> nyckel i veh_binds
+_VEH_ACTION_BINDS = (
+    ("_ACTION_THROTTLE", "throttle"),
+    ("_ACTION_BRAKE", "brake"),
+    ("_ACTION_TURN_VEHICLE_LEFT", "left"),
+    ("_ACTION_TURN_VEHICLE_RIGHT", "right"),
+    ("_ACTION_HANDBRAKE", "handbrake"),
+    ("_ACTION_VEHICLE_LEAVE", "leave"),
+    ("_ACTION_VEHICLE_CHANGE_CAMERA", "camera"),
+    ("_ACTION_CAR_LIGHTS_TOGGLE", "lights"),
+    ("_ACTION_VEHICLE_LOOKBACK", "lookback"),
+    ("_ACTION_HORN", "horn"),
+    ("_ACTION_VEHICLE_REDIRECT_TO_SAFE_HOUSE", "redirect"),
+    ("_ACTION_CAR_LIGHTS_UV", "uv"),
+)
+
+# LayoutKeybinding-block som stängs av (ersätts av AddAction ovan)
+_VEH_DISABLE_ACTIONS = frozenset(action for action, _bind_key in _VEH_ACTION_BINDS)
+
+# night_spawn_pools.scr: (pool, preset-nyckel) för MaxNoZombiesInPursuit-tak
+_NIGHT_POOL_CAP_KEYS = (
+    ("Night_Aggresion_Level_1_Easy", "ni_begin_l1"),
+    ("Night_Aggresion_Level_2_Easy", "ni_begin_l2_slums_l1"),
+    ("Night_Aggresion_Level_3_Easy", "ni_begin_l3"),
+    ("Night_Aggresion_Level_4_Easy", "ni_begin_l4_slums_l3"),
+    ("Night_Aggresion_Level_1", "ni_begin_l2_slums_l1"),
+    ("Night_Aggresion_Level_2", "ni_slums_l2"),
+    ("Night_Aggresion_Level_3", "ni_begin_l4_slums_l3"),
+    ("Night_Aggresion_Level_4", "ni_slums_l4"),
+    ("Old_Town::Night_Aggresion_Level_1", "ni_ot_l1"),
+    ("Old_Town::Night_Aggresion_Level_2", "ni_ot_l2"),
+    ("Old_Town::Night_Aggresion_Level_3", "ni_ot_l3"),
+    ("Old_Town::Night_Aggresion_Level_4", "ni_ot_l4"),
+)
+
+ENEMY_TAG_OPTIONS = [
+    "Boss", "Freak", "Biter", "Biter_boss", "Spitter_boss", "Viral", "Demolisher",
+    "Goon", "Slasher", "Defect", "Karen", "Behemoth", "Nemo", "Matriarch", "Daughter",
+    "Hologram", "Superman", "Aiden", "Baron", "Beast",
+]
+
+# Preset-nycklar per tagg (easy, normal, hard, nm) – byggs en gång
+EN_TAG_HP_KEYS = tuple(
+    (tag, tuple(f"en_tag_hp_{tag}_{diff}_pct" for diff in ("easy", "normal", "hard", "nm")))
+    for tag in ENEMY_TAG_OPTIONS
+)
+
 # -----------------------------
 # Vars (create ONCE)
 # -----------------------------
@@ -4418,6 +5183,29 @@ set_default(DEFAULTS_NI, sp_chase_limit, 15)
 # -----------------------------
 
 
+def debounce(widget, fn, ms=120):
+    """Returnerar wrapper som kör fn(*args) först när anropen slutat komma i ms millisekunder (senaste args vinner)."""
+    job = [None]
+
+    def wrapped(*args):
+        if job[0] is not None:
+            widget.after_cancel(job[0])
+
+        def _run():
+            job[0] = None
+            fn(*args)
+
+        job[0] = widget.after(ms, _run)
+
+    return wrapped
+
+
+@functools.lru_cache(maxsize=32)
+def _scale_opts(from_, to, resolution):
+    """Delade Scale-options per (from_, to, resolution) – samma kombos återkommer i många rader."""
+    return dict(from_=from_, to=to, resolution=resolution, orient="horizontal")
+
+
 def ui_labeled_slider(
     parent,
     title,
@@ -4425,17 +5213,21 @@ def ui_labeled_slider(
     from_,
     to,
     hint=None,
-    font_title=("Arial", 10),
+    font_title=FONT_LABEL,
     resolution=1,
     tight=True,
     label_width=24,
     entry_width=6,
     invert_negative=False,
     slider_length=420,      # <-- styr hur lång du vill ha den
+    grid=None,              # dict(row=, column=, ...) -> grid direkt i parent istället för pack
 ):
     row_pady = 2 if tight else 4
     row = tk.Frame(parent)
-    row.pack(fill="x", pady=(0, row_pady))
+    if grid is not None:
+        row.grid(**grid)
+    else:
+        row.pack(fill="x", pady=(0, row_pady))
 
     if title:
         tk.Label(row, text=title, font=font_title, width=label_width, anchor="w").pack(side="left")
@@ -4472,16 +5264,47 @@ def ui_labeled_slider(
         var.trace_add("write", on_var_change)
         scale_var.set(-float(var.get()))
 
-    scale = tk.Scale(
-        row,
-        from_=scale_from,
-        to=scale_to,
-        orient="horizontal",
-        variable=scale_var,
-        showvalue=1,
-        resolution=resolution,
-        length=slider_length,
-    )
+    if float(resolution).is_integer():
+        # Heltalssteg: lättare ttk.Scale, värdet syns redan i Entry-fältet
+        scale = ttk.Scale(row, from_=scale_from, to=scale_to, orient="horizontal", length=slider_length)
+        step = int(resolution)
+        _ttk_sync = {"block": False}
+
+        def _on_ttk_scale(v):
+            if _ttk_sync["block"]:
+                return
+            snapped = int(round(float(v) / step) * step)
+            try:
+                if scale_var.get() == snapped:
+                    return
+            except (tk.TclError, ValueError):
+                pass
+            scale_var.set(snapped)
+
+        def _on_ttk_var(*_):
+            # Entry/preset/reset -> flytta reglaget
+            try:
+                v = float(scale_var.get())
+            except (tk.TclError, ValueError):
+                return
+            if scale.get() != v:
+                _ttk_sync["block"] = True
+                try:
+                    scale.set(v)
+                finally:
+                    _ttk_sync["block"] = False
+
+        scale.configure(command=_on_ttk_scale)
+        scale_var.trace_add("write", _on_ttk_var)
+        _on_ttk_var()
+    else:
+        scale = tk.Scale(
+            row,
+            variable=scale_var,
+            showvalue=1,
+            length=slider_length,
+            **_scale_opts(scale_from, scale_to, resolution),
+        )
     # INTE fill/expand här, annars blir den avlång igen
     scale.pack(side="left", padx=(4, 2))
 
@@ -4489,7 +5312,11 @@ def ui_labeled_slider(
     entry.pack(side="left")
 
     if hint:
-        tk.Label(parent, text=hint, fg="#666666", font=("Arial", 8)).pack(fill="x", pady=(0, 1))
+        if grid is not None:
+            # parent styrs av grid -> hint i samma rad
+            tk.Label(row, text=hint, fg=COL_MUTED, font=FONT_SMALL).pack(side="left", padx=(4, 0))
+        else:
+            tk.Label(parent, text=hint, fg=COL_MUTED, font=FONT_SMALL).pack(fill="x", pady=(0, 1))
 
     return row, scale, entry
 
@@ -4507,12 +5334,12 @@ def ui_pick_color_btn(parent, text, r_var, g_var, b_var):
     return tk.Button(parent, text=text, command=_pick)
 
 
-def ui_section_title(parent, text, *, font=("Arial", 10, "bold"), pady=(0, 5)):
+def ui_section_title(parent, text, *, font=FONT_H3, pady=(0, 5)):
     """Centered section title."""
     tk.Label(parent, text=text, font=font).pack(fill="x", pady=pady)
 
 
-def ui_hint(parent, text, *, fg="#666666", pady=(0, 6)):
+def ui_hint(parent, text, *, fg=COL_MUTED, pady=(0, 6)):
     """Small gray helper text."""
     tk.Label(parent, text=text, fg=fg).pack(fill="x", pady=pady)
 
@@ -4619,7 +5446,7 @@ def ui_header(parent, title, subtitle=None, subtitle2=None):
         tk.Label(
             header,
             text=subtitle,
-            font=("Arial", 10),
+            font=FONT_LABEL,
             fg="#555555",
             anchor="center",
         ).pack(fill="x", pady=(2, 0))
@@ -4628,7 +5455,7 @@ def ui_header(parent, title, subtitle=None, subtitle2=None):
         tk.Label(
             header,
             text=subtitle2,
-            font=("Arial", 9),
+            font=FONT_BODY,
             fg="#777777",
             anchor="center",
         ).pack(fill="x", pady=(1, 0))
@@ -4680,7 +5507,11 @@ def set_window_icon(root, icon_path: str):
 
 def build_ui():
     ui = {}  #
-    
+
+    # Kort-ramar: färgen sätts en gång i option-databasen, varje tk.Frame ärver den
+    root.option_add("*Frame.highlightBackground", CARD_HIGHLIGHT)
+    root.option_add("*Frame.highlightColor", CARD_HIGHLIGHT)
+
     # Bottom bar (keep)
     bottom = tk.Frame(root)
     bottom.pack(side="bottom", fill="x", padx=5, pady=(2, 2))
@@ -4824,7 +5655,7 @@ def build_ui():
         roots = [
             Path(r"C:\Program Files (x86)\Steam"),
             Path(r"C:\Program Files\Steam"),
-            Path.home() / "AppData" / "Local" / "Steam",
+            HOME / "AppData" / "Local" / "Steam",
         ]
         return [p for p in roots if (p / "userdata").exists()]
     
@@ -4936,15 +5767,9 @@ def build_ui():
     sep1.pack(side="left", fill="y", padx=6, pady=6)
 
     # Save path group (red border)
-    save_path_callout_box = tk.Frame(topbar, highlightthickness=2, highlightbackground="#d00000")
-    save_path_callout_box.pack(side="left", **pad_tb)
-    save_path_callout_inner = tk.Frame(save_path_callout_box)
-    save_path_callout_inner.pack(fill="x", padx=4, pady=2)
-    save_path_row = tk.Frame(save_path_callout_inner)
+    save_path_callout_box = red_callout(topbar, padx=4, pady=2, **pad_tb)
+    save_path_row = tk.Frame(save_path_callout_box)
     save_path_row.pack(fill="x")
-    save_path_check_label = tk.Label(save_path_row, text="✓", fg="#228b22", font=("Arial", 8, "bold"))
-    save_path_check_label.pack(side="left", padx=(0, 8))
-    save_path_check_label.pack_forget()
     btn_save_auto = make_toolbar_button(save_path_row, "Auto-find save path", command=auto_find_save_path)
     btn_save_auto.pack(side="left", padx=(0, 6), pady=0)
     btn_manual = make_toolbar_button(save_path_row, "Manual save path...", command=manual_pick_save_path)
@@ -4954,8 +5779,8 @@ def build_ui():
     sep2.pack(side="left", fill="y", padx=6, pady=6)
 
     # Game folder group (red border)
-    callout_box, callout = red_callout(topbar)
-    combined_btn_row = tk.Frame(callout)
+    callout_box = red_callout(topbar)
+    combined_btn_row = tk.Frame(callout_box)
     combined_btn_row.pack(anchor="w", pady=0)
     btn_auto = make_toolbar_button(combined_btn_row, "Auto-detect Game Folder", command=None)
     btn_auto.pack(side="left", padx=(0, 6))
@@ -4987,7 +5812,7 @@ def build_ui():
         activeforeground="black",
         bd=0,
         relief="flat",
-        font=("Arial", 10, "bold"),
+        font=FONT_H3,
         padx=3,
         pady=3,
         cursor="hand2",
@@ -5010,11 +5835,7 @@ def build_ui():
         if isinstance(items, str):
             items = [(items, "ok")]
 
-        status_text.config(state="normal")
-        status_text.delete("1.0", "end")
-        for text, tag in items:
-            status_text.insert("end", str(text), tag)
-        status_text.config(state="disabled")
+        write_status(status_text, items)
 
     ui["set_status"] = set_status
     ui["status_text"] = status_text  
@@ -5049,7 +5870,7 @@ def build_ui():
         hdr = tb.Label(
             main_wrapper,
             text="Workflow: Choose mode → Tune sliders → Build & Install PAK.\n\nWelcome to Version 0.6b",
-            font=("Arial", 10),
+            font=FONT_LABEL,
             bootstyle="info",
             justify="center",
             anchor="center",
@@ -5080,7 +5901,7 @@ def build_ui():
             highlightthickness=0,
             padx=180,   # <-- justera: 120–260 beroende på fönsterbredd
             pady=0,
-            font=("Arial", 10),
+            font=FONT_LABEL,
             fg="#b8b8b8",
             bg=main_wrapper.cget("bg"),
         )
@@ -5089,7 +5910,7 @@ def build_ui():
         smm_note = tk.Label(
             main_wrapper,
             text="Please run Super Mod Merger if you have installed 3rd party mods.",
-            font=("Arial", 10, "bold"),
+            font=FONT_H3,
             fg="#ffd54a",  # mild gul
             bg=main_wrapper.cget("bg"),
             justify="center",
@@ -5139,7 +5960,6 @@ def build_ui():
         choose_mode_frame.pack(fill="x", pady=(0, 0))
         xp_badge = tk.Frame(
             choose_mode_frame,
-            highlightbackground="#8A8A8A",
             highlightthickness=2,
             bd=0,
         )
@@ -5147,11 +5967,11 @@ def build_ui():
         tk.Label(
             xp_badge,
             text="Choose XP Mode",
-            font=("Arial", 11, "bold"),
+            font=FONT_H2,
             padx=13,
             pady=8,
         ).pack()
-        xp_card = tk.Frame(choose_mode_frame, highlightthickness=1, highlightbackground="#8A8A8A")
+        xp_card = tk.Frame(choose_mode_frame, highlightthickness=1)
         xp_card.pack(fill="x", padx=50)
         radio_frame = tk.Frame(xp_card)
         radio_frame.pack(pady=(2, 0))
@@ -5180,14 +6000,11 @@ def build_ui():
         ow_wrap.pack(anchor="center")
         legend_scroll_outer, legend_scroll_inner = make_scrollable(legend_frame)
         legend_scroll_outer.pack(fill="both", expand=True)
-        for w in legend_scroll_outer.winfo_children():
-            if isinstance(w, tk.Canvas):
-                w.configure(height=320)
-                break
+        legend_scroll_outer._canvas.configure(height=320)
         tk.Label(
             ow_wrap,
             text="Open World XP Multiplier",
-            font=("Arial", 11, "bold"),
+            font=FONT_H2,
         ).pack(anchor="center", pady=(0, 0))
         row, scale, entry = ui_labeled_slider(
             ow_wrap,
@@ -5196,12 +6013,12 @@ def build_ui():
             from_=1.0,
             to=100.0,
             hint="(1 = vanilla)",
-            font_title=("Arial", 11, "bold"),
+            font_title=FONT_H2,
             resolution=1.0,
         )
-        legend_easy_var.set(1.0)
-        legend_hard_var.set(1.05)
-        legend_nightmare_var.set(1.15)
+        # mark_dirty-traces kopplas först i main() -> inga callbacks här
+        for _var, _val in ((legend_easy_var, 1.0), (legend_hard_var, 1.05), (legend_nightmare_var, 1.15)):
+            _var.set(_val)
         def refresh_advanced():
             pass  # no-op: advanced sliders are always visible now
 
@@ -5222,8 +6039,8 @@ def build_ui():
         left_col.grid(row=0, column=0, sticky="n", padx=(0, XP_COL_PADX // 2))
         tk.Label(
             left_col,
-            fg="#666666",
-            font=("Arial", 8),
+            fg=COL_MUTED,
+            font=FONT_SMALL,
         ).pack(anchor="w")
         # Left column 
         ui_labeled_slider(
@@ -5359,21 +6176,21 @@ def build_ui():
 
     fl_outer, fl_wrap = make_scrollable(flashlight_tab)
     fl_outer.pack(fill="both", expand=True)
-    tk.Label(fl_wrap, text="Flashlight", font=("Arial", 12, "bold")).pack(pady=10)
+    tk.Label(fl_wrap, text="Flashlight", font=FONT_TITLE).pack(pady=10)
 
-    fl_card = tk.Frame(fl_wrap, highlightthickness=1, highlightbackground="#8A8A8A")
+    fl_card = tk.Frame(fl_wrap, highlightthickness=1)
     fl_card.pack(padx=60, pady=12, fill="x")
 
     # --- Flashlight Colors (postprocess) ---
     colors_box = tk.Frame(fl_card)  # ingen LabelFrame-ram
     colors_box.pack(fill="x", padx=10, pady=(8, 6))
 
-    tk.Label(colors_box, text="Flashlight Colors (postprocess)", font=("Arial", 10, "bold")).pack(anchor="w")
+    tk.Label(colors_box, text="Flashlight Colors (postprocess)", font=FONT_H3).pack(anchor="w")
 
     tk.Label(
         colors_box,
         text="Defaults: Normal = [1.0, 0.95, 0.87]   UV = [0.15, 0.5, 1.0]",
-        fg="#666666",
+        fg=COL_MUTED,
     ).pack(anchor="w", pady=(4, 0))
     
     fl_colors_btn_row = tk.Frame(colors_box)
@@ -5413,7 +6230,7 @@ def build_ui():
     lf12 = tk.Frame(flashlight_controls)
     lf12.pack(fill="x", pady=(0, 10))
 
-    tk.Label(lf12, text="UV LVL 1 & 2 (shared)", font=("Arial", 10, "bold")).pack(anchor="w", pady=(0,4))
+    tk.Label(lf12, text="UV LVL 1 & 2 (shared)", font=FONT_H3).pack(anchor="w", pady=(0,4))
 
 
     ui_labeled_slider(
@@ -5443,7 +6260,7 @@ def build_ui():
         lf = tk.Frame(parent)
         lf.pack(fill="x", pady=(0, 10))
 
-        tk.Label(lf, text=title, font=("Arial", 10, "bold")).pack(anchor="w", pady=(0,4))
+        tk.Label(lf, text=title, font=FONT_H3).pack(anchor="w", pady=(0,4))
 
         ui_labeled_slider(lf, "EnergyDrainPerSecond", drain_var, from_=0.0, to=5.0, resolution=0.05)
         ui_labeled_slider(lf, "MaxEnergy", energy_var, from_=0.0, to=50.0, resolution=0.5)
@@ -5460,7 +6277,8 @@ def build_ui():
     adv_center = tk.Frame(adv_row)
     adv_center.pack()
 
-    advanced_levels_frame = tk.Frame(flashlight_controls)  # created but not packed yet
+    # skapas opackad = dold; flashlight_advanced_var är False vid start (refresh körs vid toggle/preset/reset)
+    advanced_levels_frame = tk.Frame(flashlight_controls)
 
     def refresh_flashlight_advanced():
         if flashlight_advanced_var.get():
@@ -5491,8 +6309,6 @@ def build_ui():
         advanced_levels_frame, "UV LVL 5", uv5_drain_var, uv5_energy_var, uv5_regen_var
     )
 
-    refresh_flashlight_advanced()
-
     # =========================
     # Hunger tab content (grid centering)
     # =========================
@@ -5534,7 +6350,6 @@ def build_ui():
     # --- Badge header
     hu_badge = tk.Frame(
         hu_wrapper,
-        highlightbackground="#8A8A8A",
         highlightthickness=1,
         bd=0,
     )
@@ -5552,7 +6367,7 @@ def build_ui():
     tk.Frame(hu_wrapper).grid(row=2, column=0, sticky="nsew")
 
     # --- Card (centered) ---
-    hu_card = tk.Frame(hu_wrapper, highlightthickness=1, highlightbackground="#8A8A8A")
+    hu_card = tk.Frame(hu_wrapper, highlightthickness=1)
     hu_card.grid(row=3, column=0, padx=60, sticky="ew")
 
     # --- Info button (opens popup) ---
@@ -5577,7 +6392,7 @@ def build_ui():
     info_frame.grid_columnconfigure(0, weight=0)  # numbers
     info_frame.grid_columnconfigure(1, weight=1)  # text expands
     
-    tk.Label(hu_card, text="Hunger Action Costs", font=("Arial", 11, "bold")).pack(
+    tk.Label(hu_card, text="Hunger Action Costs", font=FONT_H2).pack(
         pady=(0, 0)
     )
 
@@ -5697,7 +6512,7 @@ def build_ui():
     pl_wrapper.pack(fill="both", expand=True)
 
     pl_card = tk.Frame(
-        pl_wrapper, highlightthickness=1, highlightbackground="#8A8A8A"
+        pl_wrapper, highlightthickness=1
     )
     pl_card.pack(padx=60, pady=12, fill="x")
 
@@ -5713,25 +6528,25 @@ def build_ui():
         climb_grid,
         text="LadderClimbSlow = false",
         variable=pl_ladder_climb_slow_var,
-        font=("Arial", 9),
+        font=FONT_BODY,
     ).grid(row=0, column=0, sticky="w", padx=(0, 24), pady=0)
     tk.Checkbutton(
         climb_grid,
         text="FastClimbEnabled = true",
         variable=pl_fast_climb_enabled_var,
-        font=("Arial", 9),
+        font=FONT_BODY,
     ).grid(row=1, column=0, sticky="w", padx=(0, 24), pady=0)
     # row 0 col 1, row 1 col 1 = right column checkbuttons + warn labels added later
 
     tk.Label(
         pl_card,
         text="Movement speed (safe sliders)",
-        font=("Arial", 12, "bold"),
+        font=FONT_TITLE,
     ).pack(pady=(10, 4))
     
     pl_hint = "Bonus on top of vanilla. Multiplier = 1.0 + (bonus/100). Ex: 100% = 2.0x, 300% = 4.0x"
     
-    tk.Label(pl_card, text=pl_hint, fg="#666666", font=("Arial", 8)).pack(fill="x", pady=(0, 4)
+    tk.Label(pl_card, text=pl_hint, fg=COL_MUTED, font=FONT_SMALL).pack(fill="x", pady=(0, 4)
     )
 
     SAFE_MAX = 100
@@ -5768,17 +6583,18 @@ def build_ui():
         climb_grid,
         text=f"Override max speed {OVERRIDE_MAX}%",
         variable=override_var,
-        font=("Arial", 9),
+        font=FONT_BODY,
     )
     cb_override_speed.grid(row=0, column=1, sticky="w", padx=(0, 0), pady=0)
 
     def apply_override():
-        new_max = OVERRIDE_MAX if override_var.get() else SAFE_MAX
+        override_on = override_var.get()
+        new_max = OVERRIDE_MAX if override_on else SAFE_MAX
 
         for sc in (water_scale, land_scale, boost_scale):
             sc.config(to=new_max)
 
-        if not override_var.get():
+        if not override_on:
             for var in (pl_water_speed_pct, pl_land_speed_pct, pl_boost_speed_pct):
                 if var.get() > SAFE_MAX:
                     var.set(SAFE_MAX)
@@ -5808,15 +6624,16 @@ def build_ui():
         climb_grid,
         text=f"Override jump max {JUMP_OVERRIDE_MAX:g}",
         variable=jump_override_var,
-        font=("Arial", 9),
+        font=FONT_BODY,
     )
     cb_override_jump.grid(row=1, column=1, sticky="w", padx=(0, 0), pady=0)
 
     def apply_jump_override():
-        new_max = JUMP_OVERRIDE_MAX if jump_override_var.get() else JUMP_SAFE_MAX
+        override_on = jump_override_var.get()
+        new_max = JUMP_OVERRIDE_MAX if override_on else JUMP_SAFE_MAX
         jump_scale.config(to=new_max)
 
-        if not jump_override_var.get() and jump_boost_var.get() > JUMP_SAFE_MAX:
+        if not override_on and jump_boost_var.get() > JUMP_SAFE_MAX:
             jump_boost_var.set(JUMP_SAFE_MAX)
 
     cb_override_jump.config(command=apply_jump_override)
@@ -5834,11 +6651,11 @@ def build_ui():
 
     pad_vh, pady_vh = 36, 8
     vh_card = tk.Frame(
-        vh_wrapper, highlightthickness=1, highlightbackground="#8A8A8A"
+        vh_wrapper, highlightthickness=1
     )
     vh_card.pack(padx=pad_vh, pady=pady_vh, fill="x")
 
-    controls_card = tk.Frame(vh_wrapper, highlightthickness=1, highlightbackground="#8A8A8A")
+    controls_card = tk.Frame(vh_wrapper, highlightthickness=1)
     controls_card.pack(padx=pad_vh, pady=(0, pady_vh), fill="x")
 
     # -------------------------
@@ -5850,39 +6667,9 @@ def build_ui():
     tk.Label(
         fuel_frame,
         text="Fuel",
-        font=("Arial", 10, "bold"),
+        font=FONT_H3,
     ).pack(fill="x", anchor="center", padx=4, pady=(2, 2))
 
-    def fuel_usage_color(val):
-        # clamp 0..100
-        v = max(0.0, min(100.0, float(val)))
-        t = v / 100.0  # 0..1
-
-        # 0%  -> nästan grå men lite röd tint (svagast möjligt utan att bli osynlig)
-        r0, g0, b0 = 135, 125, 125
-        # 100% -> neutral grå (vanilla)
-        r1, g1, b1 = 145, 145, 145
-
-        r = int(r0 + (r1 - r0) * t)
-        g = int(g0 + (g1 - g0) * t)
-        b = int(b0 + (b1 - b0) * t)
-        return (r, g, b)
-
-    def fuel_max_color(val):
-        t = (val - 100) / 900.0 if val > 100 else 0.0
-        t = max(0, min(1, t))
-        if t < 0.4:
-            u = t / 0.4
-            r = int(128 * (1 - u))
-            g = int(128 * (1 - u))
-            b = int(128 + (255 - 128) * u)
-        else:
-            u = (t - 0.4) / 0.6
-            r = int(160 * u)
-            g = 0
-            b = 255
-        return (min(255, max(0, r)), min(255, max(0, g)), min(255, max(0, b)))
-
     fuel_grid = make_two_column_grid(fuel_frame)
     fuel_grid.pack(fill="x", padx=4, pady=(0, 2))
     fuel_left = tk.Frame(fuel_grid)
@@ -5899,8 +6686,8 @@ def build_ui():
     tk.Label(
         fuel_frame,
         text="100% = vanilla. Usage 0% = no drain. Max 1000% = 10× tank.",
-        fg="#666666",
-        font=("Arial", 8),
+        fg=COL_MUTED,
+        font=FONT_SMALL,
     ).pack(anchor="w", padx=8, pady=(2, 8))
 
 
@@ -5908,7 +6695,7 @@ def build_ui():
     tk.Label(
         controls_card,
         text="Vehicle keybinds",
-        font=("Arial", 10, "bold"),
+        font=FONT_H3,
     ).pack(anchor="w", pady=(6, 4))
 
     # Wrapper som håller två kolumner
@@ -5940,8 +6727,8 @@ def build_ui():
     tk.Label(
         controls_card,
         text="Note: In-game keybind settings may override these defaults. Reset binds in-game if needed.",
-        fg="#666666",
-        font=("Arial", 8),
+        fg=COL_MUTED,
+        font=FONT_SMALL,
         wraplength=560,
         justify="left",
     ).pack(anchor="w", pady=(4, 6))
@@ -5951,9 +6738,9 @@ def build_ui():
     tk.Label(
         vh_card,
         text="Vehicle health",
-        font=("Arial", 11, "bold"),
+        font=FONT_H2,
     ).pack(pady=(6, 2))
-    tk.Label(vh_card, text=vh_hint, fg="#666666", font=("Arial", 8)).pack(
+    tk.Label(vh_card, text=vh_hint, fg=COL_MUTED, font=FONT_SMALL).pack(
         fill="x", pady=(0, 6)
     )
 
@@ -6016,14 +6803,14 @@ def build_ui():
     vo_outer.pack(fill="both", expand=True)
 
     vo_card = tk.Frame(
-        vo_wrap, highlightthickness=1, highlightbackground=CARD_HIGHLIGHT, highlightcolor=CARD_HIGHLIGHT
+        vo_wrap, highlightthickness=1
     )
     vo_card.pack(padx=60, pady=12, fill="x")
 
     tk.Label(
         vo_card,
         text="Volatile perception",
-        font=("Arial", 12, "bold"),
+        font=FONT_TITLE,
     ).pack(pady=(10, 4))
 
     info_text = (
@@ -6037,56 +6824,52 @@ def build_ui():
     tk.Label(
         vo_card,
         text=info_text,
-        font=("Arial", 9),
+        font=FONT_BODY,
         wraplength=470,
         justify="center",  # centers multi-line text
         anchor="center",
     ).pack(pady=(0, 10), padx=10)
 
     # --- Dropdown for volatiles ---
-    vo_labels = [label for (label, value) in VO_MODE_OPTIONS]
-    vo_values = [value for (label, value) in VO_MODE_OPTIONS]
-    vo_label_to_value = {label: value for (label, value) in VO_MODE_OPTIONS}
-    vo_value_to_label = {value: label for (label, value) in VO_MODE_OPTIONS}
 
     row = tk.Frame(vo_card)
     row.pack(pady=(6, 10))
 
-    tk.Label(row, text="Volatile behavior:", font=("Arial", 10, "bold")).pack(
+    tk.Label(row, text="Volatile behavior:", font=FONT_H3).pack(
         side="left", padx=(0, 10)
     )
 
     vo_combo = ttk.Combobox(
         row,
-        values=vo_labels,
+        values=VO_MODE_LABELS,
         state="readonly",
         width=34,
     )
 
-    vo_combo.set(vo_value_to_label.get(vo_mode_var.get(), vo_labels[0]))
+    vo_combo.set(VO_VALUE_TO_LABEL.get(vo_mode_var.get(), VO_MODE_LABELS[0]))
     vo_combo.pack(side="left")
 
     def _on_vo_combo_change(_evt=None):
         label = vo_combo.get()
-        vo_mode_var.set(vo_label_to_value[label])
+        vo_mode_var.set(VO_LABEL_TO_VALUE[label])
 
     vo_combo.bind("<<ComboboxSelected>>", _on_vo_combo_change)
 
     # --- Alpha card section (Nightmare only) ---
     alpha_card = tk.Frame(
-        vo_wrap, highlightthickness=1, highlightbackground=CARD_HIGHLIGHT, highlightcolor=CARD_HIGHLIGHT
+        vo_wrap, highlightthickness=1
     )
     alpha_card.pack(padx=60, pady=(0, 12), fill="x")
 
     # “badge” / Nightmare-only
     alpha_badge = tk.Frame(
-        alpha_card, highlightbackground="#8A8A8A", highlightthickness=1, bd=0
+        alpha_card, highlightthickness=1, bd=0
     )
     alpha_badge.pack(pady=(10, 6))
     tk.Label(
         alpha_badge,
         text="Nightmare only — Alpha volatile",
-        font=("Arial", 9),
+        font=FONT_BODY,
         padx=12,
         pady=4,
     ).pack()
@@ -6098,31 +6881,28 @@ def build_ui():
     alpha_radio_frame.pack()
 
     # --- Dropdown for ALPHA ---
-    alpha_labels = [label for (label, value) in ALPHA_MODE_OPTIONS]
-    alpha_label_to_value = {label: value for (label, value) in ALPHA_MODE_OPTIONS}
-    alpha_value_to_label = {value: label for (label, value) in ALPHA_MODE_OPTIONS}
 
     alpha_row = tk.Frame(alpha_card)
     alpha_row.pack(pady=(6, 12))
 
-    tk.Label(alpha_row, text="Alpha behavior:", font=("Arial", 10, "bold")).pack(
+    tk.Label(alpha_row, text="Alpha behavior:", font=FONT_H3).pack(
         side="left", padx=(0, 10)
     )
 
     alpha_combo = ttk.Combobox(
-        alpha_row, values=alpha_labels, state="readonly", width=34
+        alpha_row, values=ALPHA_MODE_LABELS, state="readonly", width=34
     )
-    alpha_combo.set(alpha_value_to_label.get(alpha_mode_var.get(), alpha_labels[0]))
+    alpha_combo.set(ALPHA_VALUE_TO_LABEL.get(alpha_mode_var.get(), ALPHA_MODE_LABELS[0]))
     alpha_combo.pack(side="left")
 
     def _on_alpha_combo_change(_evt=None):
-        alpha_mode_var.set(alpha_label_to_value[alpha_combo.get()])
+        alpha_mode_var.set(ALPHA_LABEL_TO_VALUE[alpha_combo.get()])
 
     alpha_combo.bind("<<ComboboxSelected>>", _on_alpha_combo_change)
 
     # --- Spawn scaling section (AIPresetPool) ---
     spawn_card = tk.Frame(
-        vo_wrap, highlightthickness=1, highlightbackground=CARD_HIGHLIGHT, highlightcolor=CARD_HIGHLIGHT
+        vo_wrap, highlightthickness=1
     )
     spawn_card.pack(padx=60, pady=(0, 12), fill="x")
 
@@ -6133,7 +6913,7 @@ def build_ui():
         vo_weights_cb_frame,
         text="Volatile Weights",
         variable=vo_weights_visible_var,
-        font=("Arial", 9),
+        font=FONT_BODY,
     )
     vo_weights_cb.pack(anchor="center")
 
@@ -6142,24 +6922,42 @@ def build_ui():
     tk.Label(
         vo_weights_frame,
         text="Volatile weights (AIPresetPool)",
-        font=("Arial", 11, "bold"),
+        font=FONT_H2,
     ).pack(pady=(10, 4))
 
     tk.Label(
         vo_weights_frame,
         text="100% = vanilla/off. Lower scales volatile weights in night pools.\n Experimental: actual spawn changes may be hard to notice without long playtesting;other systems may override pool weights.",
-        font=("Arial", 9),
+        font=FONT_BODY,
         wraplength=460,
         justify="center",
     ).pack(pady=(0, 8), padx=10)
 
     val_lbl = tk.Label(
-        vo_weights_frame, text=f"{vo_reduce_pct_var.get()}%", font=("Arial", 10, "bold")
+        vo_weights_frame, text=f"{vo_reduce_pct_var.get()}%", font=FONT_H3
     )
     val_lbl.pack(pady=(0, 2))
 
+    # Slidern har egen var: labeln uppdateras direkt, vo_reduce_pct_var (+ mark_dirty-kaskaden) först när draget pausar
+    spawn_scale_var = tk.IntVar(vo_weights_frame, value=vo_reduce_pct_var.get())
+
+    def _commit_spawn_pct(val):
+        if vo_reduce_pct_var.get() != val:
+            vo_reduce_pct_var.set(val)
+
+    _commit_spawn_pct_later = debounce(vo_weights_frame, _commit_spawn_pct)
+
     def _on_spawn_slider(_=None):
-        val_lbl.config(text=f"{vo_reduce_pct_var.get()}%")
+        val = spawn_scale_var.get()
+        val_lbl.config(text=f"{val}%")
+        _commit_spawn_pct_later(val)
+
+    def _on_spawn_pct_var(*_):
+        # preset/reset skriver vo_reduce_pct_var direkt -> synka slider + label
+        val = vo_reduce_pct_var.get()
+        if spawn_scale_var.get() != val:
+            spawn_scale_var.set(val)
+        val_lbl.config(text=f"{val}%")
 
     spawn_slider = tk.Scale(
         vo_weights_frame,
@@ -6167,13 +6965,13 @@ def build_ui():
         to=100,  # percent
         orient="horizontal",
         resolution=1,
-        variable=vo_reduce_pct_var,
+        variable=spawn_scale_var,
         command=_on_spawn_slider,
         length=420,
     )
     spawn_slider.pack(pady=(0, 10))
 
-    _on_spawn_slider()
+    vo_reduce_pct_var.trace_add("write", _on_spawn_pct_var)
 
     def _vo_weights_toggle(*_):
         if vo_weights_visible_var.get():
@@ -6188,7 +6986,7 @@ def build_ui():
     tk.Label(
         spawn_card,
         text="Amount of volatiles",
-        font=("Arial", 10, "bold"),
+        font=FONT_H3,
     ).pack(pady=(4, 2), anchor="center")
     VO_AMOUNT_OPTIONS = [
         ("x0 (vanilla)", "0"),
@@ -6204,7 +7002,7 @@ def build_ui():
             text=label,
             variable=vo_reduce_mult_var,
             value=value,
-            font=("Arial", 9),
+            font=FONT_BODY,
         ).pack(side="left", padx=10)
 
     # --- Volatile HP multipliers (healthdefinitions.scr) ---
@@ -6212,7 +7010,7 @@ def build_ui():
     tk.Label(
         spawn_card,
         text="Volatile health multipliers",
-        font=("Arial", 10, "bold"),
+        font=FONT_H3,
     ).pack(pady=(10, 2), fill="x")
 
     ui_labeled_slider(
@@ -6239,7 +7037,7 @@ def build_ui():
         to=300,
         resolution=5,
     )
-    tk.Label(spawn_card, text=vo_hp_hint, fg="#666666", font=("Arial", 8)).pack(
+    tk.Label(spawn_card, text=vo_hp_hint, fg=COL_MUTED, font=FONT_SMALL).pack(
         fill="x", pady=(0, 6)
     )
 
@@ -6248,7 +7046,7 @@ def build_ui():
     tk.Label(
         spawn_card,
         text="Damage on volatiles multiplier ",
-        font=("Arial", 10, "bold"),
+        font=FONT_H3,
     ).pack(pady=(10, 2), fill="x")
     ui_labeled_slider(
         spawn_card,
@@ -6262,7 +7060,7 @@ def build_ui():
     ui_labeled_slider(spawn_card, "Hard", vo_dmg_bonus_hard_pct, from_=0, to=500, resolution=10)
     ui_labeled_slider(spawn_card, "Nightmare", vo_dmg_bonus_nightmare_pct, from_=0, to=500, resolution=10)
     # show hint only once
-    tk.Label(spawn_card, text=vo_dmg_hint, fg="#666666", font=("Arial", 8)).pack(
+    tk.Label(spawn_card, text=vo_dmg_hint, fg=COL_MUTED, font=FONT_SMALL).pack(
         fill="x", pady=(0, 8)
     )
 
@@ -6276,31 +7074,23 @@ def build_ui():
     en_outer.pack(fill="both", expand=True)
     
     en_card = tk.Frame(
-        en_wrap, highlightthickness=1, highlightbackground="#8A8A8A"
+        en_wrap, highlightthickness=1
     )
     en_card.pack(padx=40, pady=8, fill="x")
     
-    ENEMY_TAG_OPTIONS = [
-        "Boss", "Freak", "Biter", "Biter_boss", "Spitter_boss", "Viral", "Demolisher",
-        "Goon", "Slasher", "Defect", "Karen", "Behemoth", "Nemo", "Matriarch", "Daughter",
-        "Hologram", "Superman", "Aiden", "Baron", "Beast",
+    # list of (tag_name, easy_var, normal_var, hard_var, nm_var)
+    new_pct_var = functools.partial(tk.IntVar, root, 100)  # explicit master, 100% = vanilla
+    en_tag_hp_vars = [
+        (tag, new_pct_var(), new_pct_var(), new_pct_var(), new_pct_var())
+        for tag in ENEMY_TAG_OPTIONS
     ]
-    en_tag_hp_vars = []  # list of (tag_name, easy_var, normal_var, hard_var, nm_var)
-    for tag in ENEMY_TAG_OPTIONS:
-        en_tag_hp_vars.append((
-            tag,
-            tk.IntVar(value=100),
-            tk.IntVar(value=100),
-            tk.IntVar(value=100),
-            tk.IntVar(value=100),
-        ))
 
     en_header = tk.Frame(en_card)
     en_header.pack(fill="x", pady=(6, 2))
     tk.Label(
         en_header,
         text="Human Health Multiplier",
-        font=("Arial", 12, "bold"),
+        font=FONT_TITLE,
     ).pack(pady=(10, 2), fill="x")
     en_reset_frame = tk.Frame(en_card)
     en_reset_frame.pack(fill="x", pady=(8, 4))
@@ -6326,59 +7116,149 @@ def build_ui():
             entry_width=5,      # valfritt
         )
 
-    tk.Label(en_card, text=en_hp_hint, fg="#666666", font=("Arial", 8)).pack(
+    tk.Label(en_card, text=en_hp_hint, fg=COL_MUTED, font=FONT_SMALL).pack(
         fill="x", pady=(0, 6)
     )
 
-    # --- Enemy tag health (per-tag multipliers, 20 tags × 4 sliders) ---
+    # --- Enemy tag health (per-tag multipliers, 20 tags × 4 värden i en Treeview) ---
     tk.Label(
         en_card,
         text="Enemy Health Multiplier (per tag)",
-        font=("Arial", 11, "bold"),
+        font=FONT_H2,
     ).pack(fill="x", anchor="center", pady=(10, 4))
     en_advanced_visible = [False]
     en_advanced_frame = tk.Frame(en_card)
-    en_adv_scroll_outer, en_adv_scroll_inner = make_scrollable(en_advanced_frame)
-    en_adv_scroll_outer.pack(fill="both", expand=True)
-    for w in en_adv_scroll_outer.winfo_children():
-        if isinstance(w, tk.Canvas):
-            w.configure(height=380)
-            break
-    tk.Label(en_adv_scroll_inner, text="100% = vanilla. Set Easy/Normal/Hard/Nightmare % per tag.", fg="#666666", font=("Arial", 8)).pack(anchor="w", pady=(0, 6))
-    for tag, easy_var, normal_var, hard_var, nm_var in en_tag_hp_vars:
-        block = tk.Frame(en_adv_scroll_inner, highlightthickness=1, highlightbackground="#ddd")
-        block.pack(fill="x", pady=(0, 6))
-        tk.Label(block, text=tag, font=("Arial", 10, "bold"), anchor="center").pack(fill="x", padx=6, pady=(4, 2))
-        tag_grid = make_two_column_grid(block)
-        tag_grid.pack(fill="x", padx=4, pady=(0, 4))
-        for j, (lbl, var) in enumerate([
-            ("Easy %", easy_var), ("Normal %", normal_var), ("Hard %", hard_var), ("Nightmare %", nm_var),
-        ]):
-            cell = tk.Frame(tag_grid)
-            cell.grid(row=j // 2, column=j % 2, sticky="ew", padx=GRID_COL_PADX, pady=GRID_ROW_PADY)
-            ui_labeled_slider(cell, lbl, var, from_=10, to=500, resolution=5, label_width=10, font_title=("Arial", 9), slider_length=200)
-        
-    en_advanced_visible = [False]
+    EN_TAG_COLS = ("easy", "normal", "hard", "nm")
+    en_tag_tree_ref = [None]      # Treeview skapas först när panelen öppnas första gången
+    en_tag_tree_stale = [False]   # vars ändrade medan panelen var dold
+
+    def build_en_tag_tree():
+        tk.Label(
+            en_advanced_frame,
+            text="100% = vanilla. Double-click a cell to set Easy/Normal/Hard/Nightmare % per tag (10–500).",
+            fg=COL_MUTED,
+            font=FONT_SMALL,
+        ).pack(anchor="w", pady=(0, 6))
+
+        # Textceller istället för 80 levande Scale-widgets; en Spinbox läggs över cellen vid redigering
+        en_tag_tree_box = tk.Frame(en_advanced_frame)
+        en_tag_tree_box.pack(fill="both", expand=True)
+        en_tag_tree = ttk.Treeview(
+            en_tag_tree_box, columns=EN_TAG_COLS, show="tree headings", height=12, selectmode="browse"
+        )
+        en_tag_tree.heading("#0", text="Tag")
+        en_tag_tree.column("#0", width=140, anchor="w")
+        for col, title in zip(EN_TAG_COLS, ("Easy %", "Normal %", "Hard %", "Nightmare %")):
+            en_tag_tree.heading(col, text=title)
+            en_tag_tree.column(col, width=90, anchor="center")
+
+        en_tag_editor = [None]  # (spinbox, var) medan en cell redigeras
+        en_tag_cell_vars = {}   # (tag, col) -> IntVar
+        en_tag_cell_by_name = {}  # Tcl-varnamn -> (tag, col, IntVar), för den delade trace-callbacken
+
+        def _en_tag_close_editor(commit=True):
+            if en_tag_editor[0] is None:
+                return
+            sp, var = en_tag_editor[0]
+            en_tag_editor[0] = None
+            if commit:
+                try:
+                    var.set(max(10, min(500, int(float(sp.get())))))
+                except ValueError:
+                    pass
+            sp.destroy()
+
+        def _en_tag_yview(*args):
+            _en_tag_close_editor()
+            en_tag_tree.yview(*args)
+
+        en_tag_vsb = tb.Scrollbar(en_tag_tree_box, orient="vertical", command=_en_tag_yview, bootstyle="dark-round")
+        en_tag_tree.configure(yscrollcommand=en_tag_vsb.set)
+        en_tag_vsb.pack(side="right", fill="y")
+        en_tag_tree.pack(side="left", fill="both", expand=True)
+
+        def _en_tag_cell_refresh(var_name, *_):
+            # en callback för alla 80 vars: Tk skickar varnamnet som första argument
+            if not en_advanced_visible[0]:
+                # dold panel: rita inte celler nu, synka alla rader en gång när den visas
+                en_tag_tree_stale[0] = True
+                return
+            tag, col, var = en_tag_cell_by_name[var_name]
+            try:
+                en_tag_tree.set(tag, col, var.get())
+            except tk.TclError:
+                pass  # tomt/ogiltigt värde medan man skriver
+
+        for tag, easy_var, normal_var, hard_var, nm_var in en_tag_hp_vars:
+            tag_vars = (easy_var, normal_var, hard_var, nm_var)
+            en_tag_tree.insert("", "end", iid=tag, text=tag, values=[v.get() for v in tag_vars])
+            for col, var in zip(EN_TAG_COLS, tag_vars):
+                en_tag_cell_vars[(tag, col)] = var
+                en_tag_cell_by_name[str(var)] = (tag, col, var)
+                # preset/reset skriver vars direkt -> håll cellen i synk
+                var.trace_add("write", _en_tag_cell_refresh)
+
+        def _en_tag_edit(event):
+            if en_tag_tree.identify_region(event.x, event.y) != "cell":
+                return
+            tag = en_tag_tree.identify_row(event.y)
+            col_id = en_tag_tree.identify_column(event.x)  # "#1".."#4"
+            if not tag or col_id == "#0":
+                return
+            bbox = en_tag_tree.bbox(tag, col_id)
+            if not bbox:
+                return
+            _en_tag_close_editor()
+            var = en_tag_cell_vars[(tag, EN_TAG_COLS[int(col_id[1:]) - 1])]
+            sp = tk.Spinbox(en_tag_tree, from_=10, to=500, increment=5, justify="center")
+            sp.delete(0, "end")
+            sp.insert(0, var.get())
+            x, y, w, h = bbox
+            sp.place(x=x, y=y, width=w, height=h)
+            en_tag_editor[0] = (sp, var)
+            sp.focus_set()
+            sp.selection_range(0, "end")
+            sp.bind("<Return>", lambda _e: _en_tag_close_editor())
+            sp.bind("<KP_Enter>", lambda _e: _en_tag_close_editor())
+            sp.bind("<Escape>", lambda _e: _en_tag_close_editor(commit=False))
+            sp.bind("<FocusOut>", lambda _e: _en_tag_close_editor())
+
+        en_tag_tree.bind("<Double-1>", _en_tag_edit)
+        en_tag_tree.bind("<MouseWheel>", lambda _e: _en_tag_close_editor(), add="+")
+
+        en_tag_tree_ref[0] = en_tag_tree
+
+    def _en_tag_tree_sync():
+        en_tag_tree = en_tag_tree_ref[0]
+        if en_tag_tree is None:
+            build_en_tag_tree()  # första visningen: byggs med aktuella värden
+            return
+        if not en_tag_tree_stale[0]:
+            return
+        en_tag_tree_stale[0] = False
+        for tag, *tag_vars in en_tag_hp_vars:
+            en_tag_tree.item(tag, values=[v.get() for v in tag_vars])
 
     adv_wrap = tk.Frame(en_card)
     adv_wrap.pack(fill="x", pady=(4, 6))
 
     btn_en_advanced = tk.Button(
         adv_wrap,
-        text="Show all sliders for enemies and bosses",
-        font=("Arial", 10, "bold"),
+        text="Show health table for enemies and bosses",
+        font=FONT_H3,
     )
     btn_en_advanced.pack()  # centrerad i wrappern
 
     def toggle_en_advanced():
         if en_advanced_visible[0]:
             en_advanced_frame.pack_forget()
-            btn_en_advanced.config(text="Show all sliders for enemies and bosses")
+            btn_en_advanced.config(text="Show health table for enemies and bosses")
             en_advanced_visible[0] = False
         else:
+            _en_tag_tree_sync()
             # visa advanced direkt under knappen (wrappern), snyggt & stabilt
             en_advanced_frame.pack(fill="both", expand=False, pady=(6, 8), after=adv_wrap)
-            btn_en_advanced.config(text="Hide advanced enemy sliders")
+            btn_en_advanced.config(text="Hide enemy health table")
             en_advanced_visible[0] = True
 
     btn_en_advanced.config(command=toggle_en_advanced)
@@ -6391,42 +7271,44 @@ def build_ui():
     btn_chase_limit = tk.Button(
         chase_limit_btn_row,
         text="Show chase limit sliders",
-        font=("Arial", 10, "bold"),
+        font=FONT_H3,
     )
     btn_chase_limit.pack()
 
-    chase_limit_frame = tk.Frame(en_card, highlightthickness=1, highlightbackground="#8A8A8A")
+    chase_limit_frame = tk.Frame(en_card, highlightthickness=1)
     # chase_limit_frame not packed initially (hidden)
 
     tk.Label(
         chase_limit_frame,
         text="Chase limit — max zombies that can actively chase you (day and night).",
-        font=("Arial", 9),
-        fg="#666666",
+        font=FONT_BODY,
+        fg=COL_MUTED,
         wraplength=500,
     ).pack(fill="x", padx=8, pady=(8, 4))
 
+    # (title, var, from_, to, resolution)
     ni_slider_specs = [
-        ("Easy_Level1", ni_begin_l1, 0, 20),
-        ("Slums_Level2", ni_begin_l2_slums_l1, 0, 20),
-        ("Easy_Level3", ni_begin_l3, 0, 25),
-        ("Easy_Slums_Lvl4", ni_begin_l4_slums_l3, 0, 30),
-        ("Slums_Level2", ni_slums_l2, 0, 30),
-        ("Slums_Level4", ni_slums_l4, 0, 40),
-        ("OLDTOWN_Lvl1", ni_ot_l1, 0, 30),
-        ("OLDTOWN_Lvl2", ni_ot_l2, 0, 30),
-        ("OLDTOWN_Lvl3", ni_ot_l3, 0, 40),
-        ("OLDTOWN_Lvl4", ni_ot_l4, 0, 50),
-        ("Chase limit", sp_chase_limit, 0, 100),
+        ("Easy_Level1", ni_begin_l1, 0, 20, 1),
+        ("Slums_Level2", ni_begin_l2_slums_l1, 0, 20, 1),
+        ("Easy_Level3", ni_begin_l3, 0, 25, 1),
+        ("Easy_Slums_Lvl4", ni_begin_l4_slums_l3, 0, 30, 1),
+        ("Slums_Level2", ni_slums_l2, 0, 30, 1),
+        ("Slums_Level4", ni_slums_l4, 0, 40, 1),
+        ("OLDTOWN_Lvl1", ni_ot_l1, 0, 30, 1),
+        ("OLDTOWN_Lvl2", ni_ot_l2, 0, 30, 1),
+        ("OLDTOWN_Lvl3", ni_ot_l3, 0, 40, 1),
+        ("OLDTOWN_Lvl4", ni_ot_l4, 0, 50, 1),
+        ("Chase limit", sp_chase_limit, 0, 100, 5),
     ]
     chase_grid = make_two_column_grid(chase_limit_frame)
     chase_grid.pack(fill="x", padx=8, pady=(0, 4))
-    for i, (title, var, from_, to) in enumerate(ni_slider_specs):
-        cell = tk.Frame(chase_grid)
-        cell.grid(row=i // 2, column=i % 2, sticky="ew", padx=GRID_COL_PADX, pady=GRID_ROW_PADY)
-        res = 5 if "Chase limit" in title else 1
-        ui_labeled_slider(cell, title, var, from_=from_, to=to, resolution=res, slider_length=220)
-    tk.Label(chase_limit_frame, text="Hard cap 100. Vanilla 15.", fg="#666666", font=("Arial", 8)).pack(fill="x", pady=(0, 2), padx=8)
+    for i, (title, var, from_, to, res) in enumerate(ni_slider_specs):
+        # raden grid:as direkt i chase_grid (ingen extra cell-frame per slider)
+        ui_labeled_slider(
+            chase_grid, title, var, from_=from_, to=to, resolution=res, slider_length=220,
+            grid=dict(row=i // 2, column=i % 2, sticky="ew", padx=GRID_COL_PADX, pady=GRID_ROW_PADY),
+        )
+    tk.Label(chase_limit_frame, text="Hard cap 100. Vanilla 15.", fg=COL_MUTED, font=FONT_SMALL).pack(fill="x", pady=(0, 2), padx=8)
 
     btn_reset_ni = tk.Button(chase_limit_frame, text="Reset Chase limit to defaults")
     btn_reset_ni.pack(pady=(10, 14))
@@ -6461,7 +7343,7 @@ def build_ui():
     tk.Label(
         spawn_banner_body,
         text="Spawns disabled (game v1.5+)",
-        font=("Arial", 12, "bold"),
+        font=FONT_TITLE,
         fg="#2b2b2b",
         bg="#fff1f1",
         anchor="w",
@@ -6471,7 +7353,7 @@ def build_ui():
         spawn_banner_body,
         text="Spawn-related tweaks currently have no effect due to game changes in v1.5+.\n"
              "I’ll re-enable this section if/when a reliable method becomes available.",
-        font=("Arial", 9),
+        font=FONT_BODY,
         fg="#444444",
         bg="#fff1f1",
         wraplength=650,
@@ -6557,13 +7439,8 @@ def build_ui():
         ("en_human_hp_bonus_hard_pct", en_human_hp_bonus_hard_pct),
         ("en_human_hp_bonus_nightmare_pct", en_human_hp_bonus_nightmare_pct),
     ]
-    for tag, easy_var, normal_var, hard_var, nm_var in en_tag_hp_vars:
-        preset_vars.extend([
-            (f"en_tag_hp_{tag}_easy_pct", easy_var),
-            (f"en_tag_hp_{tag}_normal_pct", normal_var),
-            (f"en_tag_hp_{tag}_hard_pct", hard_var),
-            (f"en_tag_hp_{tag}_nm_pct", nm_var),
-        ])
+    for (_tag, tag_keys), (_tag_again, *tag_vars) in zip(EN_TAG_HP_KEYS, en_tag_hp_vars):
+        preset_vars.extend(zip(tag_keys, tag_vars))
     preset_vars += [
         ("pl_water_speed_pct", pl_water_speed_pct),
         ("pl_land_speed_pct", pl_land_speed_pct),
@@ -6625,12 +7502,79 @@ def build_ui():
 # -----------------------------
 # 7) UI callbacks (apply, build, status, refresh)
 # -----------------------------
+def _build_spawn_patchers_v15(
+    vals, ai_spawn_priority_patchers, ai_spawn_system_patchers, spawn_logic_patchers, densitiessettings_patchers
+) -> None:
+    """Spawn-patchers (ai_spawn_*, spawn logic, densities). Används bara när SPAWNS_SUPPORTED."""
+    _adv = sp_advanced_tuning_var.get()
+    if _adv and en_spawn_priority_var.get():
+        ai_spawn_priority_patchers.append(
+            patch_param_value_optional("EnablePrioritizationOfSpawners", "true")
+        )
+    _max_ai = int(sp_max_spawned_ai.get())
+    _ag, _sp, _gp, _ap = _compute_spawn_limits_from_master(int(sp_dynamic_spawner_master.get()))
+    ai_spawn_system_patchers.append(
+        patch_ai_spawn_system(
+            max_spawned_ai=_max_ai,
+            auto_cache=True if not _adv else sp_auto_cache_var.get(),
+            manual_cache=int(sp_cache_manual.get()),
+            dialog_limit=50 if not _adv else int(vals["sp_dialog_limit"]),
+            chase_limit=min(100, int(vals["sp_chase_limit"])),
+            advanced_limits=_adv,
+            agenda_limit=_ag,
+            spawner_limit=_sp,
+            dynamic_limit=_sp,
+            challenge_limit=_gp,
+            gameplay_limit=_gp,
+            aiproxy_limit=_ap,
+            story_limit=_ag,
+            boost_darkzones=sp_boost_darkzones_var.get() if _adv else False,
+        )
+    )
+    if _adv:
+        _ai_density = int(sp_ai_density_max.get())
+        spawn_logic_patchers.append(
+            patch_common_dynamic_spawn_logic(
+                spawn_radius_night=float(sp_spawn_radius_night.get()),
+                inner_radius_spawn=float(sp_inner_radius_spawn.get()),
+                ai_density_max=_ai_density,
+                ai_density_ignore=sp_ai_density_ignore_var.get(),
+            )
+        )
+    else:
+        _sr, _ir, _adm, _adi = _compute_spawn_logic_from_max_ai(_max_ai)
+        _ai_density = _adm
+        spawn_logic_patchers.append(
+            patch_common_dynamic_spawn_logic(
+                spawn_radius_night=_sr,
+                inner_radius_spawn=_ir,
+                ai_density_max=_adm,
+                ai_density_ignore=_adi,
+                no_op=(_max_ai == 80),
+            )
+        )
+    densitiessettings_patchers.append(
+        patch_global_densities_scaled_by_aidensity(_ai_density)
+    )
+
+
+def _skip_spawn_patchers(*_args) -> None:
+    pass
+
+
+# väljs en gång vid import, ingen SPAWNS_SUPPORTED-gren per build
+_build_spawn_patchers = _build_spawn_patchers_v15 if SPAWNS_SUPPORTED else _skip_spawn_patchers
+
+
 def main():
     import shutil, os
 
     shutil.rmtree("scripts", ignore_errors=True)
     os.makedirs("scripts", exist_ok=True)
+    sweep_mods_trash()
 
+    # Göm fönstret medan alla flikar byggs -> en layout-pass vid deiconify istället för en per pack
+    root.withdraw()
     ui = build_ui()
 
     openworld_frame = ui["openworld_frame"]
@@ -6663,12 +7607,22 @@ def main():
     jump_boost_var = ui["jump_boost_var"]
     jump_override_var = ui["jump_override_var"]
 
+    # löses upp en gång här: None om UI:t saknar callbacken
     refresh_advanced = ui.get("refresh_advanced")
+    if not callable(refresh_advanced):
+        refresh_advanced = None
     refresh_flashlight_advanced = ui.get("refresh_flashlight_advanced")
+    if not callable(refresh_flashlight_advanced):
+        refresh_flashlight_advanced = None
+    refresh_enemies_spawn = ui.get("refresh_enemies_spawn_ui")
+    if not callable(refresh_enemies_spawn):
+        refresh_enemies_spawn = None
     alpha_mode = alpha_mode_var.get()
 
     def get_patchers_for_build(veh_binds):
-    
+        # en Tcl-läsning per preset-var, sedan bara dict-uppslag
+        vals = {k: v.get() for k, v in preset_vars}
+
         player_patchers: List[Patcher] = []
         prog_patchers: List[Patcher] = []
         inv_patchers: List[Patcher] = []
@@ -6685,62 +7639,44 @@ def main():
         healthdefinitions_patchers: List[Patcher] = []  # healthdefinitions.scr
         fuel_patchers: List[Patcher] = []  # fuel params (usage/max) for all 3 buggy scripts
 
-        inputs_keyboard_patchers: List[Patcher] = []  # inputs_keyboard.scr
-
-        inputs_keyboard_patchers.append(patch_addaction_device_and_key("_ACTION_THROTTLE", to_input_token(veh_binds["throttle"].get())))
-        inputs_keyboard_patchers.append(patch_addaction_device_and_key("_ACTION_BRAKE", to_input_token(veh_binds["brake"].get())))
-        inputs_keyboard_patchers.append(patch_addaction_device_and_key("_ACTION_TURN_VEHICLE_LEFT", to_input_token(veh_binds["left"].get())))
-        inputs_keyboard_patchers.append(patch_addaction_device_and_key("_ACTION_TURN_VEHICLE_RIGHT", to_input_token(veh_binds["right"].get())))
-        inputs_keyboard_patchers.append(patch_addaction_device_and_key("_ACTION_HANDBRAKE", to_input_token(veh_binds["handbrake"].get())))
-        inputs_keyboard_patchers.append(patch_addaction_device_and_key("_ACTION_VEHICLE_LEAVE", to_input_token(veh_binds["leave"].get())))
-        inputs_keyboard_patchers.append(patch_addaction_device_and_key("_ACTION_VEHICLE_CHANGE_CAMERA", to_input_token(veh_binds["camera"].get())))
-        inputs_keyboard_patchers.append(patch_addaction_device_and_key("_ACTION_CAR_LIGHTS_TOGGLE", to_input_token(veh_binds["lights"].get())))
-        inputs_keyboard_patchers.append(patch_addaction_device_and_key("_ACTION_VEHICLE_LOOKBACK", to_input_token(veh_binds["lookback"].get())))
-        inputs_keyboard_patchers.append(patch_addaction_device_and_key("_ACTION_HORN", to_input_token(veh_binds["horn"].get())))
-        inputs_keyboard_patchers.append(patch_addaction_device_and_key("_ACTION_VEHICLE_REDIRECT_TO_SAFE_HOUSE", to_input_token(veh_binds["redirect"].get())))
-        inputs_keyboard_patchers.append(patch_addaction_device_and_key("_ACTION_CAR_LIGHTS_UV", to_input_token(veh_binds["uv"].get())))
-        inputs_keyboard_patchers.append(patch_disable_layout_keybinding_for_action("ACTION_THROTTLE"))
-        inputs_keyboard_patchers.append(patch_disable_layout_keybinding_for_action("_ACTION_BRAKE"))
-        inputs_keyboard_patchers.append(patch_disable_layout_keybinding_for_action("_ACTION_TURN_VEHICLE_LEFT"))
-        inputs_keyboard_patchers.append(patch_disable_layout_keybinding_for_action("_ACTION_TURN_VEHICLE_RIGHT"))
-        inputs_keyboard_patchers.append(patch_disable_layout_keybinding_for_action("_ACTION_HANDBRAKE"))
-        inputs_keyboard_patchers.append(patch_disable_layout_keybinding_for_action("_ACTION_VEHICLE_LEAVE"))
-        inputs_keyboard_patchers.append(patch_disable_layout_keybinding_for_action("_ACTION_VEHICLE_CHANGE_CAMERA"))
-        inputs_keyboard_patchers.append(patch_disable_layout_keybinding_for_action("_ACTION_CAR_LIGHTS_TOGGLE"))
-        inputs_keyboard_patchers.append(patch_disable_layout_keybinding_for_action("_ACTION_VEHICLE_LOOKBACK"))
-        inputs_keyboard_patchers.append(patch_disable_layout_keybinding_for_action("_ACTION_HORN"))
-        inputs_keyboard_patchers.append(patch_disable_layout_keybinding_for_action("_ACTION_VEHICLE_REDIRECT_TO_SAFE_HOUSE"))
-        inputs_keyboard_patchers.append(patch_disable_layout_keybinding_for_action("_ACTION_CAR_LIGHTS_UV"))
+        # inputs_keyboard.scr: per fordons-action en AddAction (ny tangent),
+        # sedan alla fordons-LayoutKeybindings avstängda i ett enda pass
+        inputs_keyboard_patchers: List[Patcher] = [
+            patch_addaction_device_and_key(action, to_input_token(veh_binds[bind_key].get()))
+            for action, bind_key in _VEH_ACTION_BINDS
+        ]
+        inputs_keyboard_patchers.append(patch_disable_layout_keybindings_for_actions(_VEH_DISABLE_ACTIONS))
 
 
         # --- Hunger patches ---
-        if hunger_enabled_var.get():
+        if vals["hunger_enabled_var"]:
             hunger_patchers.append(
                 patch_hunger_buckets(
-                    cost_05=hu_cost_05.get(),
-                    cost_10=hu_cost_10.get(),
-                    cost_20=hu_cost_20.get(),
-                    cost_30=hu_cost_30.get(),
-                    cost_40=hu_cost_40.get(),
+                    cost_05=vals["hu_cost_05"],
+                    cost_10=vals["hu_cost_10"],
+                    cost_20=vals["hu_cost_20"],
+                    cost_30=vals["hu_cost_30"],
+                    cost_40=vals["hu_cost_40"],
                 )
             )
 
-            is_off = (
-                hu_decrease_speed.get() == 0.0
-                and hu_mul_dash.get() == 0.0
-                and hu_mul_fury.get() == 0.0
-                and hu_resting_cost.get() == 0.0
-                and hu_revived_cost.get() == 0.0
-                and hu_cost_05.get() == 0.0
-                and hu_cost_10.get() == 0.0
-                and hu_cost_20.get() == 0.0
-                and hu_cost_30.get() == 0.0
-                and hu_cost_40.get() == 0.0
+        # alla hunger-värden 0 -> "av"; kortsluter på första icke-noll
+        is_off = (
+            vals["hunger_enabled_var"]
+            and all(
+                vals[k] == 0.0
+                for k in ("hu_cost_05", "hu_cost_10", "hu_cost_20", "hu_cost_30", "hu_cost_40")
             )
+            and all(
+                v.get() == 0.0
+                for v in (hu_decrease_speed, hu_mul_dash, hu_mul_fury, hu_resting_cost, hu_revived_cost)
+            )
+        )
 
-        if is_off:
-            player_patchers.append(
-                patch_player_variables_hunger_extras(
+        def _hunger_player_patchers():
+            if is_off:
+                # is_off => alla hunger-värden är redan 0, ett enda extras-patch räcker
+                yield patch_player_variables_hunger_extras(
                     decrease_speed=0.0,
                     starving_threshold=0.0,
                     resting_cost=0.0,
@@ -6748,131 +7684,110 @@ def main():
                     mul_dash=0.0,
                     mul_fury=0.0,
                 )
-            )
-
-            player_patchers.append(
-                patch_player_variables_hunger_extras(
-                    decrease_speed=hu_decrease_speed.get(),
-                    starving_threshold=0.0,  #
-                    resting_cost=hu_resting_cost.get(),
-                    revived_cost=hu_revived_cost.get(),
-                    mul_dash=hu_mul_dash.get(),
-                    mul_fury=hu_mul_fury.get(),
-                )
-            )
+                # player_variables.scr (Nightmare unlimited toggle)
+                yield patch_unlimited_nightmare_flashlight(vals["nightmare_unlimited_var"])
+            if hunger_restore_full_var.get():
+                yield patch_restore_hunger_to_full(1000.0)
 
-            # player_variables.scr (Nightmare unlimited toggle)
-            player_patchers.append(
-                patch_unlimited_nightmare_flashlight(nightmare_unlimited_var.get())
-            )
+        player_patchers.extend(_hunger_player_patchers())
 
-        if hunger_restore_full_var.get():
-            player_patchers.append(patch_restore_hunger_to_full(1000.0))
-            
-        # Jump + fall
+        # Jump + fall (värdena binds nu, patchern läser inga Tk-vars när den körs)
         player_patchers.append(
-            lambda c, ui=ui: patch_jump_and_fall_direct(
-                c,
-                ui["jump_boost_var"].get(),
-                ui["jump_override_var"].get()
+            functools.partial(
+                patch_jump_and_fall_direct,
+                jump_value=vals["jump_boost_var"],
+                override_on=vals["jump_override_var"],
             )
         )
         # -----------------
         # Alpha volatile (apex)
         # -----------------
-        if alpha_enabled_var.get():
-            alpha_mode = alpha_mode_var.get()
-
-            if alpha_mode in ("vanilla", "none"):
-                pass
-            elif alpha_mode == "pacify":
-                volatiles_patchers.append(
-                    patch_delete_perception_profiles(
-                        names=("volatile_apex", "volatile_apex_nightmare"),
-                        exclude_names=("volatile_aiden",),
-                    )
-                )
-            else:
-                volatiles_patchers.append(
-                    patch_ai_perception_profiles(
-                        target_prefixes=("volatile_apex",),
-                        mode=alpha_mode,
-                        resting_profile="volatile_hive_resting",
-                        exclude_names=("volatile_aiden",),
-                    )
-                )
+        if vals["alpha_enabled_var"]:
+            alpha_mode = vals["alpha_mode_var"]
+            p = ALPHA_MODE_BUILDERS.get(alpha_mode, _alpha_profile)(alpha_mode)
+            if p is not None:
+                volatiles_patchers.append(p)
 
         # -----------------
         # XP mode
         # -----------------
-        if mode.get() == "openworld":
-            player_patchers.append(patch_openworld_xp(openworld_var.get()))
+        if vals["mode"] == "openworld":
+            player_patchers.append(patch_openworld_xp(vals["openworld_var"]))
         else:
-            if ll_xp_loss_var.get() != 100:
-                player_patchers.append(patch_ll_xp_loss_scale(ll_xp_loss_var.get()))
+            ll_xp_loss = vals["ll_xp_loss_var"]
+            if ll_xp_loss != 100:
+                player_patchers.append(patch_ll_xp_loss_scale(ll_xp_loss))
 
             prog_patchers.append(
                 patch_legend_bonus(
-                    legend_easy_var.get(),
-                    legend_hard_var.get(),
-                    legend_nightmare_var.get(),
+                    vals["legend_easy_var"],
+                    vals["legend_hard_var"],
+                    vals["legend_nightmare_var"],
                 )
             )
-            penalty_val = legend_penalty_var.get()
+            penalty_val = vals["legend_penalty_var"]
             if penalty_val == 1.0:
                 prog_patchers.append(patch_legend_bonus_penalty_game_defaults())
             else:
                 prog_patchers.append(patch_legend_bonus_penalty_universal(penalty_val))
-            prog_patchers.append(patch_ngplus_multiplier(ngplus_var.get()))
-            prog_patchers.append(patch_coop_multiplier(coop_var.get()))
-            prog_patchers.append(patch_legendpoints_quest(quest_lp_var.get()))
+            prog_patchers.append(patch_ngplus_multiplier(vals["ngplus_var"]))
+            prog_patchers.append(patch_coop_multiplier(vals["coop_var"]))
+            prog_patchers.append(patch_legendpoints_quest(vals["quest_lp_var"]))
 
         # XP loss override (death penalty levels)
         if xp_loss_override_var.get():
             player_patchers.append(
-                patch_scale_death_penalty_levels(xp_loss_scale_var.get())
+                patch_scale_death_penalty_levels(vals["xp_loss_scale_var"])
             )
 
         # -----------------
         # Player movement speed (player_variables.scr)
         # -----------------
-        player_patchers.append(
-            patch_player_movement_speed(
-                water_pct=int(pl_water_speed_pct.get()),
-                land_pct=int(pl_land_speed_pct.get()),
-                boost_pct=int(pl_boost_speed_pct.get()),
-            )
+        move_pcts = (
+            int(vals["pl_water_speed_pct"]),
+            int(vals["pl_land_speed_pct"]),
+            int(vals["pl_boost_speed_pct"]),
         )
-        player_patchers.append(
-            patch_player_climb_options(
-                ladder_climb_slow=pl_ladder_climb_slow_var.get(),
-                fast_climb_enabled=pl_fast_climb_enabled_var.get(),
+        if move_pcts != (0, 0, 0):
+            water_pct, land_pct, boost_pct = move_pcts
+            player_patchers.append(
+                patch_player_movement_speed(
+                    water_pct=water_pct,
+                    land_pct=land_pct,
+                    boost_pct=boost_pct,
+                )
+            )
+        if vals["pl_ladder_climb_slow_var"] or vals["pl_fast_climb_enabled_var"]:
+            player_patchers.append(
+                patch_player_climb_options(
+                    ladder_climb_slow=vals["pl_ladder_climb_slow_var"],
+                    fast_climb_enabled=vals["pl_fast_climb_enabled_var"],
+                )
             )
-        )
 
         # -----------------
         # ai_difficulty_modifiers.scr (volatile damage + human HP)
         # -----------------
         ai_difficulty_patchers.append(
             patch_volatile_damage_bonus(
-                bonus_easy_pct=int(vo_dmg_bonus_easy_pct.get()),
-                bonus_normal_pct=int(vo_dmg_bonus_normal_pct.get()),
-                bonus_hard_pct=int(vo_dmg_bonus_hard_pct.get()),
-                bonus_nightmare_pct=int(vo_dmg_bonus_nightmare_pct.get()),
+                bonus_easy_pct=int(vals["vo_dmg_bonus_easy_pct"]),
+                bonus_normal_pct=int(vals["vo_dmg_bonus_normal_pct"]),
+                bonus_hard_pct=int(vals["vo_dmg_bonus_hard_pct"]),
+                bonus_nightmare_pct=int(vals["vo_dmg_bonus_nightmare_pct"]),
             )
         )
         ai_difficulty_patchers.append(
             patch_human_health_bonus(
-                bonus_easy_pct=int(en_human_hp_bonus_easy_pct.get()),
-                bonus_normal_pct=int(en_human_hp_bonus_normal_pct.get()),
-                bonus_hard_pct=int(en_human_hp_bonus_hard_pct.get()),
-                bonus_nightmare_pct=int(en_human_hp_bonus_nightmare_pct.get()),
+                bonus_easy_pct=int(vals["en_human_hp_bonus_easy_pct"]),
+                bonus_normal_pct=int(vals["en_human_hp_bonus_normal_pct"]),
+                bonus_hard_pct=int(vals["en_human_hp_bonus_hard_pct"]),
+                bonus_nightmare_pct=int(vals["en_human_hp_bonus_nightmare_pct"]),
             )
         )
-        # Enemy tag health: one patcher per tag when not all 100%
-        for tag, easy_var, normal_var, hard_var, nm_var in en_tag_hp_vars:
-            e, n, h, nm = int(easy_var.get()), int(normal_var.get()), int(hard_var.get()), int(nm_var.get())
-            if (e, n, h, nm) != (100, 100, 100, 100):
+        # Enemy tag health: one patcher per tag when not all 100% (värden redan i vals, inga Tcl-anrop)
+        for tag, tag_keys in EN_TAG_HP_KEYS:
+            e, n, h, nm = pcts = tuple(int(vals[k]) for k in tag_keys)
+            if pcts != (100, 100, 100, 100):
                 ai_difficulty_patchers.append(
                     patch_enemy_tag_health_multipliers(
                         tag_name=tag,
@@ -6886,62 +7801,18 @@ def main():
         # -----------------
         # Spawn patchers (disabled when SPAWNS_SUPPORTED=False - no effect in game v1.5+)
         # -----------------
-        if SPAWNS_SUPPORTED:
-            if sp_advanced_tuning_var.get() and en_spawn_priority_var.get():
-                ai_spawn_priority_patchers.append(
-                    patch_param_value_optional("EnablePrioritizationOfSpawners", "true")
-                )
-            _adv = sp_advanced_tuning_var.get()
-            _max_ai = int(sp_max_spawned_ai.get())
-            _ag, _sp, _gp, _ap = _compute_spawn_limits_from_master(int(sp_dynamic_spawner_master.get()))
-            ai_spawn_system_patchers.append(
-                patch_ai_spawn_system(
-                    max_spawned_ai=_max_ai,
-                    auto_cache=True if not _adv else sp_auto_cache_var.get(),
-                    manual_cache=int(sp_cache_manual.get()),
-                    dialog_limit=50 if not _adv else int(sp_dialog_limit.get()),
-                    chase_limit=min(100, int(sp_chase_limit.get())),
-                    advanced_limits=_adv,
-                    agenda_limit=_ag,
-                    spawner_limit=_sp,
-                    dynamic_limit=_sp,
-                    challenge_limit=_gp,
-                    gameplay_limit=_gp,
-                    aiproxy_limit=_ap,
-                    story_limit=_ag,
-                    boost_darkzones=sp_boost_darkzones_var.get() if _adv else False,
-                )
-            )
-            if _adv:
-                _ai_density = int(sp_ai_density_max.get())
-                spawn_logic_patchers.append(
-                    patch_common_dynamic_spawn_logic(
-                        spawn_radius_night=float(sp_spawn_radius_night.get()),
-                        inner_radius_spawn=float(sp_inner_radius_spawn.get()),
-                        ai_density_max=_ai_density,
-                        ai_density_ignore=sp_ai_density_ignore_var.get(),
-                    )
-                )
-            else:
-                _sr, _ir, _adm, _adi = _compute_spawn_logic_from_max_ai(_max_ai)
-                _ai_density = _adm
-                spawn_logic_patchers.append(
-                    patch_common_dynamic_spawn_logic(
-                        spawn_radius_night=_sr,
-                        inner_radius_spawn=_ir,
-                        ai_density_max=_adm,
-                        ai_density_ignore=_adi,
-                        no_op=(_max_ai == 80),
-                    )
-                )
-            densitiessettings_patchers.append(
-                patch_global_densities_scaled_by_aidensity(_ai_density)
-            )
+        _build_spawn_patchers(
+            vals,
+            ai_spawn_priority_patchers,
+            ai_spawn_system_patchers,
+            spawn_logic_patchers,
+            densitiessettings_patchers,
+        )
 
         # -----------------
         # Volatile spawn scaling (aipresetpool)
         # -----------------
-        pct = int(vo_reduce_pct_var.get())
+        pct = int(vals["vo_reduce_pct"])
         if pct != 100:
             aipresetpool_patchers.append(
                 patch_volatile_weights_scale_for_pools(
@@ -6954,185 +7825,125 @@ def main():
         # -----------------
         # Volatile dropdown perception
         # -----------------
-        if volatiles_enabled_var.get():
-            vo_mode = vo_mode_var.get()
-
-            if vo_mode in ("vanilla", "none"):
-                pass
-            elif vo_mode == "pacify":
-                volatiles_patchers.append(
-                    patch_delete_perception_profiles(
-                        names=(
-                            "volatile_default",
-                            "volatile_patrol_nightmare",
-                            "volatile_patrol",
-                            "volatile_nightmare",
-                            "volatile_chase",
-                            "volatile_chase_nightmare",
-                            "volatile_sun_immune",
-                        ),
-                        exclude_names=(
-                            "volatile_aiden",
-                            "volatile_stinger",
-                            "volatile_hive_default",
-                            "volatile_hive_mq06",
-                            "volatile_hive_nightmare",
-                            "volatile_summoner_default",
-                            "volatile_summoner_nightmare",
-                            "alpha_zombie_default",
-                        ),
-                    )
-                )
-            else:
-                volatiles_patchers.append(
-                    patch_ai_perception_profiles(
-                        target_prefixes=("volatile_",),
-                        mode=vo_mode,
-                        resting_profile="volatile_hive_resting",
-                        exclude_names=(
-                            "volatile_aiden",
-                            "volatile_stinger",
-                            "volatile_hive_default",
-                        ),
-                    )
-                )
+        if vals["volatiles_enabled_var"]:
+            vo_mode = vals["vo_mode_var"]
+            p = VO_MODE_BUILDERS.get(vo_mode, _vo_profile)(vo_mode)
+            if p is not None:
+                volatiles_patchers.append(p)
 
         # -----------------
         # Volatile HP multipliers (healthdefinitions.scr)
         # -----------------
-        healthdefinitions_patchers.append(
-            patch_volatile_health_multipliers(
-                volatile_pct=int(vo_hp_volatile_pct.get()),
-                hive_pct=int(vo_hp_hive_pct.get()),
-                apex_pct=int(vo_hp_apex_pct.get()),
-            )
+        # 100% överallt = vanilla -> lägg inte ens till patchern
+        vo_hp = (
+            int(vals["vo_hp_volatile_pct"]),
+            int(vals["vo_hp_hive_pct"]),
+            int(vals["vo_hp_apex_pct"]),
         )
-        healthdefinitions_patchers.append(
-            patch_vehicle_health(
-                vehicle_pickup_pct=int(veh_pickup_pct.get()),
-                vehicle_pickup_ctb_pct=int(veh_pickup_ctb_pct.get()),
+        if vo_hp != (100, 100, 100):
+            volatile_pct, hive_pct, apex_pct = vo_hp
+            healthdefinitions_patchers.append(
+                patch_volatile_health_multipliers(
+                    volatile_pct=volatile_pct,
+                    hive_pct=hive_pct,
+                    apex_pct=apex_pct,
+                )
+            )
+        veh_hp = (int(vals["veh_pickup_pct"]), int(vals["veh_pickup_ctb_pct"]))
+        if veh_hp != (100, 100):
+            healthdefinitions_patchers.append(
+                patch_vehicle_health(
+                    vehicle_pickup_pct=veh_hp[0],
+                    vehicle_pickup_ctb_pct=veh_hp[1],
+                )
             )
-        )
 
         # -----------------
         # Night patches
         # -----------------
-        if night_enabled_var.get():
+        if vals["night_enabled_var"]:
             night_patchers.append(
                 patch_night_pursuit_caps(
-                    pool_to_cap={
-                        "Night_Aggresion_Level_1_Easy": ni_begin_l1.get(),
-                        "Night_Aggresion_Level_2_Easy": ni_begin_l2_slums_l1.get(),
-                        "Night_Aggresion_Level_3_Easy": ni_begin_l3.get(),
-                        "Night_Aggresion_Level_4_Easy": ni_begin_l4_slums_l3.get(),
-                        "Night_Aggresion_Level_1": ni_begin_l2_slums_l1.get(),
-                        "Night_Aggresion_Level_2": ni_slums_l2.get(),
-                        "Night_Aggresion_Level_3": ni_begin_l4_slums_l3.get(),
-                        "Night_Aggresion_Level_4": ni_slums_l4.get(),
-                        "Old_Town::Night_Aggresion_Level_1": ni_ot_l1.get(),
-                        "Old_Town::Night_Aggresion_Level_2": ni_ot_l2.get(),
-                        "Old_Town::Night_Aggresion_Level_3": ni_ot_l3.get(),
-                        "Old_Town::Night_Aggresion_Level_4": ni_ot_l4.get(),
-                    }
+                    pool_to_cap={pool: vals[key] for pool, key in _NIGHT_POOL_CAP_KEYS}
                 )
             )
 
         # -----------------
         # Flashlight patches
         # -----------------
-        if flashlight_enabled_var.get():
+        if vals["flashlight_enabled_var"]:
             overlay_patchers.append(
                 patch_varvec3(
-                    "v_flashlight_pp_color", pp_r.get(), pp_g.get(), pp_b.get()
+                    "v_flashlight_pp_color", vals["pp_r"], vals["pp_g"], vals["pp_b"]
                 )
             )
             overlay_patchers.append(
                 patch_varvec3(
-                    "v_flashlight_pp_uv_color", uv_r.get(), uv_g.get(), uv_b.get()
+                    "v_flashlight_pp_uv_color", vals["uv_r"], vals["uv_g"], vals["uv_b"]
                 )
             )
             player_patchers.append(
-                patch_unlimited_nightmare_flashlight(nightmare_unlimited_var.get())
-            )
-            inv_patchers.extend(
-                patch_flashlight_grouped(
-                    lvl1=FlashlightParams(
-                        uv12_drain_var.get(),
-                        uv12_energy_var.get(),
-                        fl_regen_delay_uv1_var.get(),
-                    ),
-                    lvl2=FlashlightParams(
-                        uv12_drain_var.get(),
-                        uv12_energy_var.get(),
-                        fl_regen_delay_uv2_var.get(),
-                    ),
-                    lvl3=FlashlightParams(
-                        uv3_drain_var.get(), uv3_energy_var.get(), uv3_regen_var.get()
-                    ),
-                    lvl4=FlashlightParams(
-                        uv4_drain_var.get(), uv4_energy_var.get(), uv4_regen_var.get()
-                    ),
-                    lvl5=FlashlightParams(
-                        uv5_drain_var.get(), uv5_energy_var.get(), uv5_regen_var.get()
-                    ),
-                )
+                patch_unlimited_nightmare_flashlight(vals["nightmare_unlimited_var"])
             )
 
-        # inventory_special.scr (UV LVL 1–5)
+        # inventory_special.scr (UV LVL 1–5) - alltid, en gång (oavsett flashlight_enabled)
+        uv12_drain = vals["uv12_drain_var"]
+        uv12_energy = vals["uv12_energy_var"]
         inv_patchers.extend(
             patch_flashlight_grouped(
                 lvl1=FlashlightParams(
-                    drain_per_second=uv12_drain_var.get(),
-                    max_energy=uv12_energy_var.get(),
-                    regen_delay=fl_regen_delay_uv1_var.get(),
+                    drain_per_second=uv12_drain,
+                    max_energy=uv12_energy,
+                    regen_delay=vals["fl_regen_delay_uv1_var"],
                 ),
                 lvl2=FlashlightParams(
-                    drain_per_second=uv12_drain_var.get(),
-                    max_energy=uv12_energy_var.get(),
-                    regen_delay=fl_regen_delay_uv2_var.get(),
+                    drain_per_second=uv12_drain,
+                    max_energy=uv12_energy,
+                    regen_delay=vals["fl_regen_delay_uv2_var"],
                 ),
                 lvl3=FlashlightParams(
-                    drain_per_second=uv3_drain_var.get(),
-                    max_energy=uv3_energy_var.get(),
-                    regen_delay=uv3_regen_var.get(),
+                    drain_per_second=vals["uv3_drain_var"],
+                    max_energy=vals["uv3_energy_var"],
+                    regen_delay=vals["uv3_regen_var"],
                 ),
                 lvl4=FlashlightParams(
-                    drain_per_second=uv4_drain_var.get(),
-                    max_energy=uv4_energy_var.get(),
-                    regen_delay=uv4_regen_var.get(),
+                    drain_per_second=vals["uv4_drain_var"],
+                    max_energy=vals["uv4_energy_var"],
+                    regen_delay=vals["uv4_regen_var"],
                 ),
                 lvl5=FlashlightParams(
-                    drain_per_second=uv5_drain_var.get(),
-                    max_energy=uv5_energy_var.get(),
-                    regen_delay=uv5_regen_var.get(),
+                    drain_per_second=vals["uv5_drain_var"],
+                    max_energy=vals["uv5_energy_var"],
+                    regen_delay=vals["uv5_regen_var"],
                 ),
             )
         )
 
-        if fuel_usage_pct.get() != 100:
-            fuel_patchers.append(patch_paramfloat_mul("fuel_usage_base", fuel_usage_pct.get() / 100.0))
-        if fuel_max_pct.get() != 100:
-            fuel_patchers.append(patch_paramfloat_mul("fuel_max_amount", fuel_max_pct.get() / 100.0))
-
-        return (
-            player_patchers,
-            prog_patchers,
-            inv_patchers,
-            overlay_patchers,
-            hunger_patchers,
-            night_patchers,
-            volatiles_patchers,
-            aipresetpool_patchers,
-            ai_difficulty_patchers,
-            ai_spawn_priority_patchers,
-            ai_spawn_system_patchers,
-            spawn_logic_patchers,
-            densitiessettings_patchers,
-            healthdefinitions_patchers,
-            inputs_keyboard_patchers,
-            fuel_patchers,
-    )    
-        
+        fuel_usage = fuel_usage_pct.get()
+        fuel_max = fuel_max_pct.get()
+        if fuel_usage != 100:
+            fuel_patchers.append(patch_paramfloat_mul("fuel_usage_base", fuel_usage / 100.0))
+        if fuel_max != 100:
+            fuel_patchers.append(patch_paramfloat_mul("fuel_max_amount", fuel_max / 100.0))
+
+        return PatcherBundle(
+            player=player_patchers,
+            prog=prog_patchers,
+            inv=inv_patchers,
+            overlay=overlay_patchers,
+            hunger=hunger_patchers,
+            night=night_patchers,
+            volatiles=volatiles_patchers,
+            aipresetpool=aipresetpool_patchers,
+            ai_difficulty=ai_difficulty_patchers,
+            ai_spawn_priority=ai_spawn_priority_patchers,
+            ai_spawn_system=ai_spawn_system_patchers,
+            spawn_logic=spawn_logic_patchers,
+            densitiessettings=densitiessettings_patchers,
+            healthdefinitions=healthdefinitions_patchers,
+            inputs_keyboard=inputs_keyboard_patchers,
+            fuel=fuel_patchers,
+        )
 
     def do_reset_xp():
         cur_mode = mode.get()
@@ -7140,7 +7951,7 @@ def main():
         mode.set(cur_mode)
 
         applied_ok.set(False)
-        if callable(refresh_advanced):
+        if refresh_advanced is not None:
             refresh_advanced()
         refresh_buttons()
         update_mode()
@@ -7149,7 +7960,7 @@ def main():
     def do_reset_fl():
         reset_defaults(DEFAULTS_FL)
         applied_ok.set(False)
-        if callable(refresh_flashlight_advanced):
+        if refresh_flashlight_advanced is not None:
             refresh_flashlight_advanced()
         refresh_buttons()
         set_status([(" Reset Flashlight tab to defaults.", "warn")])
@@ -7209,8 +8020,7 @@ def main():
             nm_var.set(100)
         applied_ok.set(False)
         refresh_buttons()
-        refresh_enemies_spawn = ui.get("refresh_enemies_spawn_ui")
-        if callable(refresh_enemies_spawn):
+        if refresh_enemies_spawn is not None:
             refresh_enemies_spawn()
         set_status([(" Reset Enemies tab to defaults.", "warn")])
 
@@ -7223,15 +8033,8 @@ def main():
     btn_reset_vh.config(command=do_reset_vh)
     btn_reset_en.config(command=do_reset_en)
 
-    def _write_status(widget, parts):
-        widget.config(state="normal")
-        widget.delete("1.0", "end")
-        for text, tag in parts:
-            widget.insert("end", text, tag)
-        widget.config(state="disabled")
-
     def set_status(parts):
-        _write_status(status_text, parts)
+        write_status(status_text, parts)
 
     def do_load_preset():
         path = filedialog.askopenfilename(
@@ -7242,15 +8045,14 @@ def main():
             return
 
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = preset_read(path)
 
             preset_apply(preset_vars, data)
             applied_ok.set(False)
 
-            if callable(refresh_advanced):
+            if refresh_advanced is not None:
                 refresh_advanced()
-            if callable(refresh_flashlight_advanced):
+            if refresh_flashlight_advanced is not None:
                 refresh_flashlight_advanced()
 
             update_mode()
@@ -7271,8 +8073,7 @@ def main():
 
         try:
             data = preset_dump(preset_vars)
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
+            preset_write(path, data)
 
             set_status([(" Preset saved ✔", "ok")])
 
@@ -7294,9 +8095,19 @@ def main():
 
         vo_reduce_pct_var.trace_add("write", on_spawn_scale_change)
 
+    # isdir-resultat per sökväg; töms när game_path_var skrivs (se trace nedan)
+    _path_ok_cache = {}
+
+    def _path_ok(path):
+        ok = _path_ok_cache.get(path)
+        if ok is None:
+            ok = bool(path) and os.path.isdir(os.path.join(path, "ph_ft", "source"))
+            _path_ok_cache[path] = ok
+        return ok
+
     def refresh_buttons(*_):
         path = game_path_var.get()
-        path_ok = bool(path) and os.path.isdir(os.path.join(path, "ph_ft", "source"))
+        path_ok = _path_ok(path)
 
         btn_apply.config(state=("normal" if path_ok else "disabled"))
         btn_build.config(
@@ -7376,19 +8187,37 @@ def main():
     if btn_restore_hunger:
         btn_restore_hunger.config(command=do_restore_hunger)
 
-    def mark_dirty(*_):
+    # applied_ok nollas direkt; status + refresh_buttons körs max en gång per 50 ms
+    # (preset-load / reset / slider-drag skriver många gånger i rad -> en refresh istället för N)
+    DIRTY_FLUSH_MS = 50
+    _dirty = {"pending": False, "notify": False}
+
+    def _flush_dirty():
+        _dirty["pending"] = False
+        notify = _dirty["notify"]
+        _dirty["notify"] = False
         if applied_ok.get():
+            # Apply hann köras efter ändringen -> redan uppdaterat
+            return
+        if notify:
             set_status([(" Settings changed — press Apply", "warn")])
-        applied_ok.set(False)
         refresh_buttons()
 
+    def mark_dirty(*_):
+        if applied_ok.get():
+            _dirty["notify"] = True
+        applied_ok.set(False)
+        if not _dirty["pending"]:
+            _dirty["pending"] = True
+            root.after(DIRTY_FLUSH_MS, _flush_dirty)
+
 
     def update_mode(*_):
         openworld_frame.pack_forget()
         legend_frame.pack_forget()
         if mode.get() == "openworld":
             advanced_var.set(False)
-            if callable(refresh_advanced):
+            if refresh_advanced is not None:
                 refresh_advanced()
             openworld_frame.pack(fill="x", padx=20, pady=4)
         else:
@@ -7431,79 +8260,28 @@ def main():
  
     def build_and_install(_veh_binds=veh_binds):
         try:
-            clear_scripts()
-            # HARD RESET: se till att inga gamla skript följer med i paken
-            shutil.rmtree("scripts", ignore_errors=True)
+            game_path = game_path_var.get()
+            # scripts/ rensades helt vid start -> det enda som kan ligga där är våra egna utfiler;
+            # oförändrade lämnas orörda, de som inte skrivs i detta bygge tas bort efteråt
+            begin_scripts_build()
             os.makedirs("scripts", exist_ok=True)
 
-            # delete generated overlay file (optional)
-            overlay_out = "scripts/varlist_game_overlay.scr"
-            if os.path.exists(overlay_out):
-                os.remove(overlay_out)
-
-            (
-                player_patchers,
-                prog_patchers,
-                inv_patchers,
-                overlay_patchers,
-                hunger_patchers,
-                night_patchers,
-                volatiles_patchers,
-                aipresetpool_patchers,
-                ai_difficulty_patchers,
-                ai_spawn_priority_patchers,
-                ai_spawn_system_patchers,
-                spawn_logic_patchers,
-                densitiessettings_patchers,
-                healthdefinitions_patchers,
-                inputs_keyboard_patchers,
-                fuel_patchers,
-            ) = get_patchers_for_build(_veh_binds)
-
-            write_player_variables(player_patchers)
-            deploy_enabled_mod_files(Path(game_path_var.get().strip()))
-            if prog_patchers:
-                write_progression_actions(prog_patchers)
-            if inv_patchers:
-                write_inventory_special(inv_patchers)
-            if overlay_patchers:
-                write_varlist_game_overlay(overlay_patchers)
-            if hunger_patchers:
-                write_player_hunger_config(hunger_patchers)
-            if night_patchers:
-                write_player_nightspawn_config(night_patchers)
-            if volatiles_patchers:
-                write_player_volatiles_config(volatiles_patchers)
-            if aipresetpool_patchers:
-                write_aipresetpool_config(aipresetpool_patchers)
-            write_ai_difficulty_modifiers(ai_difficulty_patchers)
-            if SPAWNS_SUPPORTED:
-                write_ai_spawn_priority_system(ai_spawn_priority_patchers)
-                write_ai_spawn_system_params(ai_spawn_system_patchers)
-                if spawn_logic_patchers:
-                    write_common_dynamic_spawn_logic(spawn_logic_patchers)
-                write_densitiessettings(densitiessettings_patchers)
-
-            write_healthdefinitions(healthdefinitions_patchers)
-            write_inputs_keyboard(inputs_keyboard_patchers)
-            write_fuel_params(
-                "templates/buggy_defender_fuel_params.scr",
-                "scripts/vehicles/buggy_defender_fuel_params.scr",
-                fuel_patchers,
-            )
-            write_fuel_params(
-                "templates/buggy_madriders_fuel_params.scr",
-                "scripts/vehicles/buggy_madriders_fuel_params.scr",
-                fuel_patchers,
-            )
-            write_fuel_params(
-                "templates/buggy_wasteland_fuel_params.scr",
-                "scripts/vehicles/buggy_wasteland_fuel_params.scr",
-                fuel_patchers,
-            )
+            pb = get_patchers_for_build(_veh_binds)
+
+            # varje write_* läser en egen template och skriver en egen fil, patchers är rena str->str
+            # -> kör dem parallellt; paken byggs först när alla är klara
+            write_jobs = write_jobs_for(pb)
+
+            with ThreadPoolExecutor(max_workers=min(len(write_jobs), os.cpu_count() or 4)) as ex:
+                futures = [ex.submit(fn, patchers) for fn, patchers in write_jobs]
+                deploy_enabled_mod_files(Path(game_path.strip()))
+                for fut in futures:
+                    fut.result()  # första felet går vidare till except nedan
+
+            remove_stale_scripts()
 
             build_pak()
-            install_pak(game_path_var.get())
+            install_pak(game_path)
             backup_player_save(save_path_var.get())
             hunger_restore_full_var.set(False)
             if SPAWNS_SUPPORTED:
@@ -7523,16 +8301,15 @@ def main():
             game_path_var.set(path)
             save_game_path(path)
             set_status([(" Game folder auto-detected: ", "ok"), (path, "ok")])
-            refresh_buttons()
         except Exception as e:
             set_status([(" Auto-detect failed: ", "warn"), (str(e), "warn")])
 
     def choose_game_folder():
         path = filedialog.askdirectory(title="Select Dying Light The Beast folder")
         if path:
+            forget_auto_detected_game_folder()
             game_path_var.set(path)
             save_game_path(path)
-            refresh_buttons()
                         
     def backup_player_save(src_str: str):
         src_str = (src_str or "").strip()
@@ -7544,15 +8321,32 @@ def main():
             messagebox.showerror("Invalid save path", f"Selected save path does not exist:\n{src}")
             return
 
-        BACKUPS_DIR.mkdir(parents=True, exist_ok=True)
+        ensure_backups_dir()
 
         stamp = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
         dst = BACKUPS_DIR / f"save_backup_{stamp}"
 
-        try:
-            shutil.copytree(src, dst)
-        except Exception as e:
-            messagebox.showerror("Backup failed", f"Could not backup saves:\n{e}")
+        # kopieringen kan vara stor -> egen tråd, resultatet hämtas på Tk-tråden via after-polling
+        result_q = queue.Queue()
+
+        def _do():
+            try:
+                copy_save_backup(src, dst)
+                result_q.put(None)
+            except Exception as e:
+                result_q.put(e)
+
+        def _poll():
+            try:
+                err = result_q.get_nowait()
+            except queue.Empty:
+                root.after(100, _poll)
+                return
+            if err is not None:
+                messagebox.showerror("Backup failed", f"Could not backup saves:\n{err}")
+
+        threading.Thread(target=_do, daemon=True).start()
+        root.after(100, _poll)
 
 
 
@@ -7567,8 +8361,14 @@ def main():
     if btn_save_preset:
         btn_save_preset.config(command=do_save_preset)
 
+    # bara när läget byts: highlightthickness ändrar geometrin -> ingen omlayout per tangenttryck
+    _save_path_set = [None]
+
     def update_save_path_callout(*_):
         path_set = bool((save_path_var.get() or "").strip())
+        if path_set == _save_path_set[0]:
+            return
+        _save_path_set[0] = path_set
         if path_set:
             save_path_callout_box.config(highlightthickness=0)
         else:
@@ -7577,98 +8377,71 @@ def main():
     save_path_var.trace_add("write", update_save_path_callout)
 
     # traces
-    game_path_var.trace_add("write", lambda *_: refresh_buttons())
+    # game_path_var-trace är enda vägen till refresh_buttons vid nytt spelfolder;
+    # flera writes i samma event -> en refresh vid idle
+    _path_refresh = {"pending": False}
+
+    def _flush_path_refresh():
+        _path_refresh["pending"] = False
+        refresh_buttons()
+
+    def _on_game_path_change(*_):
+        _path_ok_cache.clear()
+        if not _path_refresh["pending"]:
+            _path_refresh["pending"] = True
+            root.after_idle(_flush_path_refresh)
+
+    game_path_var.trace_add("write", _on_game_path_change)
 
     mode.trace_add("write", update_mode)
 
-    openworld_var.trace_add("write", mark_dirty)
-
-    legend_easy_var.trace_add("write", mark_dirty)
-    legend_hard_var.trace_add("write", mark_dirty)
-    legend_nightmare_var.trace_add("write", mark_dirty)
-    xp_loss_scale_var.trace_add("write", mark_dirty)
-    ll_xp_loss_var.trace_add("write", mark_dirty)
-    legend_penalty_var.trace_add("write", mark_dirty)
-    ngplus_var.trace_add("write", mark_dirty)
-    coop_var.trace_add("write", mark_dirty)
-    quest_lp_var.trace_add("write", mark_dirty)
-
-    flashlight_enabled_var.trace_add("write", mark_dirty)
-    nightmare_unlimited_var.trace_add("write", mark_dirty)
-    flashlight_advanced_var.trace_add("write", mark_dirty)
-
-    pp_r.trace_add("write", mark_dirty)
-    pp_g.trace_add("write", mark_dirty)
-    pp_b.trace_add("write", mark_dirty)
-    uv_r.trace_add("write", mark_dirty)
-    uv_g.trace_add("write", mark_dirty)
-    uv_b.trace_add("write", mark_dirty)
-
-    uv12_drain_var.trace_add("write", mark_dirty)
-    uv12_energy_var.trace_add("write", mark_dirty)
-    fl_regen_delay_uv1_var.trace_add("write", mark_dirty)
-    fl_regen_delay_uv2_var.trace_add("write", mark_dirty)
-
-    uv3_drain_var.trace_add("write", mark_dirty)
-    uv3_energy_var.trace_add("write", mark_dirty)
-    uv3_regen_var.trace_add("write", mark_dirty)
-
-    uv4_drain_var.trace_add("write", mark_dirty)
-    uv4_energy_var.trace_add("write", mark_dirty)
-    uv4_regen_var.trace_add("write", mark_dirty)
-
-    uv5_drain_var.trace_add("write", mark_dirty)
-    uv5_energy_var.trace_add("write", mark_dirty)
-    uv5_regen_var.trace_add("write", mark_dirty)
-
-    hunger_enabled_var.trace_add("write", mark_dirty)
-    hu_cost_05.trace_add("write", mark_dirty)
-    hu_cost_10.trace_add("write", mark_dirty)
-    hu_cost_20.trace_add("write", mark_dirty)
-    hu_cost_30.trace_add("write", mark_dirty)
-    hu_cost_40.trace_add("write", mark_dirty)
-    night_enabled_var.trace_add("write", mark_dirty)
-    hu_decrease_speed.trace_add("write", mark_dirty)
-    hu_mul_dash.trace_add("write", mark_dirty)
-    hu_mul_fury.trace_add("write", mark_dirty)
-    hu_resting_cost.trace_add("write", mark_dirty)
-    hu_revived_cost.trace_add("write", mark_dirty)
-    vo_mode_var.trace_add("write", mark_dirty)
-    vo_weights_visible_var.trace_add("write", mark_dirty)
-    vo_hp_volatile_pct.trace_add("write", mark_dirty)
-    vo_hp_hive_pct.trace_add("write", mark_dirty)
-    vo_hp_apex_pct.trace_add("write", mark_dirty)
-    veh_pickup_pct.trace_add("write", mark_dirty)
-    veh_pickup_ctb_pct.trace_add("write", mark_dirty)
-    pl_ladder_climb_slow_var.trace_add("write", mark_dirty)
-    pl_fast_climb_enabled_var.trace_add("write", mark_dirty)
-    pl_land_speed_pct.trace_add("write", mark_dirty)
-    pl_water_speed_pct.trace_add("write", mark_dirty)
-    pl_boost_speed_pct.trace_add("write", mark_dirty)
-    en_spawn_priority_var.trace_add("write", mark_dirty)
-    en_human_hp_bonus_easy_pct.trace_add("write", mark_dirty)
-    en_human_hp_bonus_normal_pct.trace_add("write", mark_dirty)
-    en_human_hp_bonus_hard_pct.trace_add("write", mark_dirty)
-    en_human_hp_bonus_nightmare_pct.trace_add("write", mark_dirty)
-    sp_max_spawned_ai.trace_add("write", mark_dirty)
-    sp_auto_cache_var.trace_add("write", mark_dirty)
-    sp_dialog_limit.trace_add("write", mark_dirty)
-    sp_chase_limit.trace_add("write", mark_dirty)
-    sp_cache_manual.trace_add("write", mark_dirty)
-    sp_advanced_tuning_var.trace_add("write", mark_dirty)
-    sp_boost_darkzones_var.trace_add("write", mark_dirty)
-    sp_dynamic_spawner_master.trace_add("write", mark_dirty)
-    sp_spawn_radius_night.trace_add("write", mark_dirty)
-    sp_inner_radius_spawn.trace_add("write", mark_dirty)
-    sp_ai_density_max.trace_add("write", mark_dirty)
-    sp_ai_density_ignore_var.trace_add("write", mark_dirty)
+    # Alla settings-vars -> mark_dirty (en loop istället för en rad per var)
+    dirty_vars = (
+        openworld_var, legend_easy_var, legend_hard_var, legend_nightmare_var, xp_loss_scale_var,
+        ll_xp_loss_var, legend_penalty_var, ngplus_var, coop_var, quest_lp_var,
+        flashlight_enabled_var, nightmare_unlimited_var, flashlight_advanced_var, pp_r, pp_g, pp_b,
+        uv_r, uv_g, uv_b, uv12_drain_var, uv12_energy_var, fl_regen_delay_uv1_var,
+        fl_regen_delay_uv2_var, uv3_drain_var, uv3_energy_var, uv3_regen_var, uv4_drain_var,
+        uv4_energy_var, uv4_regen_var, uv5_drain_var, uv5_energy_var, uv5_regen_var,
+        hunger_enabled_var, hu_cost_05, hu_cost_10, hu_cost_20, hu_cost_30, hu_cost_40,
+        night_enabled_var, hu_decrease_speed, hu_mul_dash, hu_mul_fury, hu_resting_cost,
+        hu_revived_cost, vo_mode_var, vo_weights_visible_var, vo_hp_volatile_pct, vo_hp_hive_pct,
+        vo_hp_apex_pct, veh_pickup_pct, veh_pickup_ctb_pct, pl_ladder_climb_slow_var,
+        pl_fast_climb_enabled_var, pl_land_speed_pct, pl_water_speed_pct, pl_boost_speed_pct,
+        en_spawn_priority_var, en_human_hp_bonus_easy_pct, en_human_hp_bonus_normal_pct,
+        en_human_hp_bonus_hard_pct, en_human_hp_bonus_nightmare_pct, sp_auto_cache_var,
+        sp_dialog_limit, sp_chase_limit, sp_cache_manual, sp_advanced_tuning_var,
+        sp_boost_darkzones_var, sp_dynamic_spawner_master, sp_spawn_radius_night,
+        sp_inner_radius_spawn, sp_ai_density_max, sp_ai_density_ignore_var,
+    )
+    # trace_add registrerar ett nytt Tcl-kommando per anrop -> registrera mark_dirty en gång
+    # och låt alla vars dela samma kommando
+    _mark_dirty_cmd = root.register(mark_dirty)
+    for v in dirty_vars:
+        root.tk.call("trace", "add", "variable", str(v), ("write",), _mark_dirty_cmd)
+
+    # En enda trace för max AI: reset skriver den via både DEFAULTS_SP och DEFAULTS_EN -> bara riktiga ändringar räknas
+    _sp_max_prev = [sp_max_spawned_ai.get()]
+
+    def _sp_on_max_change(*_):
+        try:
+            val = int(sp_max_spawned_ai.get())
+        except (tk.TclError, ValueError):
+            return
+        if val == _sp_max_prev[0]:
+            return
+        _sp_max_prev[0] = val
+        mark_dirty()
+
+    sp_max_spawned_ai.trace_add("write", _sp_on_max_change)
 
     # init
     ensure_dirs()
-    game_path_var.set(load_game_path())
+    game_path_var.set(load_game_path())  # trace -> refresh_buttons vid idle
     update_mode()
-    refresh_buttons()
 
+    root.update_idletasks()
+    root.deiconify()
     root.mainloop()
 
 